@@ -0,0 +1,85 @@
+"""
+Preprocessing benchmark for Lingo-Live
+Compares the 'basic' and 'adaptive' OCR preprocessing paths on synthetic
+captures: preprocessing time, OCR time, pixels sent to Tesseract and
+character accuracy (if Tesseract is installed).
+
+Usage: python benchmarks/preprocess_benchmark.py [repeats]
+"""
+
+import difflib
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from PIL import Image, ImageDraw, ImageFont
+
+from services.ocr_service import OCRService
+
+TEXT = ["The quick brown fox jumps over the lazy dog.",
+        "Settings saved successfully. Restart to apply.",
+        "File  Edit  View  Window  Help"]
+
+
+def render(font_size, dark=False, skew=0.0, scale=1):
+    """Render TEXT like a UI capture."""
+    try:
+        font = ImageFont.load_default(size=font_size * scale)
+    except TypeError:
+        font = ImageFont.load_default()
+    bg, fg = ((30, 30, 40), (220, 220, 220)) if dark else ((250, 250, 250), (20, 20, 20))
+    line = int(font_size * scale * 1.6)
+    img = Image.new('RGB', (int(font_size * scale * 32), line * len(TEXT) + 20 * scale), bg)
+    draw = ImageDraw.Draw(img)
+    for i, text in enumerate(TEXT):
+        draw.text((10 * scale, 10 * scale + i * line), text, fill=fg, font=font)
+    if skew:
+        img = img.rotate(skew, resample=Image.BICUBIC, expand=True, fillcolor=bg)
+    return img
+
+
+CASES = {
+    "tiny UI text (9px)": render(9),
+    "normal text (14px)": render(14),
+    "dark theme (14px)": render(14, dark=True),
+    "skewed 3 deg (14px)": render(14, skew=3),
+    "4K selection (14px x3)": render(14, scale=3),
+}
+
+
+def accuracy(text):
+    expected = ' '.join(' '.join(TEXT).split())
+    return difflib.SequenceMatcher(None, expected, text).ratio()
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    ocr = OCRService()
+    ocr.cache = None
+    has_tesseract = ocr.is_available()
+    if not has_tesseract:
+        print("Tesseract not found - reporting preprocessing time only\n")
+
+    print(f"{'case':<24}{'mode':<10}{'prep ms':>9}{'ocr ms':>9}{'pixels':>11}{'acc':>7}")
+    for name, image in CASES.items():
+        for mode in ('basic', 'adaptive'):
+            start = time.perf_counter()
+            for _ in range(repeats):
+                prepared = ocr.preprocess_image(image, mode)
+            prep_ms = (time.perf_counter() - start) * 1000 / repeats
+
+            ocr_ms, acc = float('nan'), float('nan')
+            if has_tesseract:
+                start = time.perf_counter()
+                text = ocr.extract_text(prepared, preprocess=False)
+                ocr_ms = (time.perf_counter() - start) * 1000
+                acc = accuracy(text)
+
+            pixels = prepared.size[0] * prepared.size[1]
+            print(f"{name:<24}{mode:<10}{prep_ms:>9.1f}{ocr_ms:>9.0f}{pixels:>11,}{acc:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,9 @@ X button and ESC hide the window; Quit button exits.
 
 import customtkinter as ctk
 import tkinter as tk
-from PIL import ImageGrab
+from PIL import ImageEnhance, ImageTk
 import threading
+import numpy as np
 import keyboard
 import sys
 import os
@@ -21,7 +22,15 @@ from config import (
     OVERLAY_WIDTH, OVERLAY_HEIGHT, OVERLAY_OPACITY,
     OVERLAY_BG_COLOR, OVERLAY_TEXT_COLOR, OVERLAY_ACCENT_COLOR,
     OVERLAY_FONT_FAMILY, OVERLAY_FONT_SIZE,
-    SUPPORTED_LANGUAGES, DEFAULT_TARGET_LANGUAGE
+    SUPPORTED_LANGUAGES, DEFAULT_TARGET_LANGUAGE, STREAM_TRANSLATION,
+    NOISE_GATE, NOISE_MIN_WORD_CONF, FREEZE_FRAME,
+    WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL, WATCH_CHANGE_THRESHOLD, WATCH_DEBOUNCE,
+    CAPTURE_WIDTH, CAPTURE_HEIGHT, HOVER_DWELL, HOVER_MOVE_TOLERANCE, HOVER_CACHE_SIZE,
+    RECORDER_ENABLED, RECORDER_SECONDS, RECORDER_INTERVAL, RECORDER_MAX_MB, RECORDER_SCALE,
+    RECALL_HOTKEY, SCREEN_INDEX, SCREEN_INDEX_INTERVAL, SCREEN_INDEX_CELL,
+    SCREEN_INDEX_LANGS, SCREEN_INDEX_MIN_GAP, OCR_CANDIDATE_LANGS,
+    TEXT_FIRST, TEXT_FIRST_COPY, TEXT_FIRST_TIMEOUT,
+    REGION_PRESETS_FILE, REGION_TUNING_RUNS, SPECULATIVE_TRANSLATION, SPECULATIVE_LANGUAGES
 )
 
 HOTKEY = 'ctrl+alt+t'
@@ -59,24 +68,49 @@ class LingoLiveApp:
         from services.ocr_service import OCRService
         from services.translation_service import TranslationService
         from services.gemini_service import GeminiService
+        from services.noise_gate import NoiseGate
+        from services.region_presets import RegionPresets
+        from services.capture_service import ScreenCaptureService
         from services.ocr_service import OCRService
         from services.translation_service import TranslationService
         from services.gemini_service import GeminiService
         from settings_manager import SettingsManager
         import tkinter.font as tkfont
         
+        self.capture = ScreenCaptureService()
         self.ocr = OCRService()
         self.translator = TranslationService()
         self.gemini = GeminiService()
+        self.noise_gate = NoiseGate(NOISE_MIN_WORD_CONF) if NOISE_GATE else None
+        self.presets = RegionPresets(self.ocr, REGION_PRESETS_FILE, REGION_TUNING_RUNS)
+        self.text_source = None
+        if TEXT_FIRST:
+            from services.text_source import TextSource
+            self.text_source = TextSource(TEXT_FIRST_TIMEOUT, TEXT_FIRST_COPY)
         self.settings_manager = SettingsManager()
         self.current_language = DEFAULT_TARGET_LANGUAGE
         
         self.running = True
         self.in_selection = False
         self.selection_window = None
+        self._sel_frame = None
+        self._sel_requested_at = None   # Hotkey time, for the hotkey-to-crosshair log
+        self._frozen_photo = None
+        self.last_region = None   # (x, y, w, h) of the last selection, screen pixels
+        self.watcher = None
+        self._watch_text = ""
+        self.hover = None
+        self.recorder = None
+        self.indexer = None
+        self.scroller = None      # (RegionWatcher, ScrollStitcher) while scroll capture runs
+        self._scroll_parts = ([], [])
+        self._recall_photo = None
+        self._window_rect = None   # (x, y, w, h) of the main window, for hover to skip
         self.is_maximized = False
         self.normal_geometry = None
         self.last_translated_text = ""  # Store for TTS
+        self.last_source_text = ""      # Original of the last result, re-translated on a language change
+        self._speculated = None         # Source already sent for speculative translation
         self.tts_available = False
         self._init_tts()
         
@@ -88,6 +122,7 @@ class LingoLiveApp:
         ctk.set_default_color_theme("blue")
         
         self._build_main_window()
+        self._build_selector()
         
     def _build_main_window(self):
         """Build persistent main window."""
@@ -151,6 +186,44 @@ class LingoLiveApp:
                                       command=self._new_selection)
         self.new_btn.pack(side="right", padx=(0, 5))
 
+        # Watch button - keep translating the last selected region
+        self.watch_btn = ctk.CTkButton(self.header, text="👁", width=35, height=30,
+                                        fg_color="transparent", hover_color="#4CAF50",
+                                        border_width=1, border_color="#4CAF50",
+                                        command=self._toggle_watch)
+        self.watch_btn.pack(side="right", padx=(0, 5))
+
+        # Hover button - translate the line under the resting pointer
+        self.hover_btn = ctk.CTkButton(self.header, text="🖱", width=35, height=30,
+                                        fg_color="transparent", hover_color="#FF9800",
+                                        border_width=1, border_color="#FF9800",
+                                        command=self._toggle_hover)
+        self.hover_btn.pack(side="right", padx=(0, 5))
+
+        # Scroll button - stitch and translate the last region while it is scrolled
+        self.scroll_btn = ctk.CTkButton(self.header, text="📜", width=35, height=30,
+                                         fg_color="transparent", hover_color="#8BC34A",
+                                         border_width=1, border_color="#8BC34A",
+                                         command=self._toggle_scroll)
+        self.scroll_btn.pack(side="right", padx=(0, 5))
+
+        # Pin button - save the last region as a preset with its own hotkey
+        self.pin_btn = ctk.CTkButton(self.header, text="📌", width=35, height=30,
+                                      fg_color="transparent", hover_color="#E91E63",
+                                      border_width=1, border_color="#E91E63",
+                                      command=self._save_preset)
+        self.pin_btn.pack(side="right", padx=(0, 5))
+
+        # Recall button - select from what was on screen a few seconds ago
+        self.recall_btn = ctk.CTkButton(self.header, text="⏪", width=35, height=30,
+                                         fg_color="transparent", hover_color="#00BCD4",
+                                         border_width=1, border_color="#00BCD4",
+                                         command=self._recall)
+        self.recall_btn.pack(side="right", padx=(0, 5))
+        self.root.bind("<Configure>", self._track_window, add="+")
+        self.root.bind("<Map>", self._track_window, add="+")
+        self.root.bind("<Unmap>", lambda e: setattr(self, '_window_rect', None), add="+")
+
         # Summarize button
         self.summarize_btn = ctk.CTkButton(self.header, text="✨", width=35, height=30,
                                             fg_color="transparent", hover_color="#9C27B0",
@@ -225,10 +298,58 @@ class LingoLiveApp:
             self.is_maximized = True
         
     def _on_lang(self, choice):
+        previous = self.current_language
         for code, name in SUPPORTED_LANGUAGES.items():
             if name == choice:
                 self.current_language = code
                 break
+        if self.hover:
+            self.hover.clear()
+        # The language left behind is a likely switch-back target
+        self._remember_languages(self.current_language, previous)
+        self._retranslate_last()
+
+    def _remember_languages(self, *codes):
+        """Keep the most recently used target languages (newest first) for speculation."""
+        codes = list(dict.fromkeys(codes))
+        recent = [c for c in self.settings_manager.get("recent_languages", []) if c not in codes]
+        self.settings_manager.set("recent_languages", (codes + recent)[:SPECULATIVE_LANGUAGES + 1])
+
+    def _retranslate_last(self):
+        """Show the last source text in the new language - from the cache if possible, no re-OCR."""
+        source, code = self.last_source_text, self.current_language
+        if not source:
+            return
+        self.status.configure(text="⏳ Translating...")
+
+        def done(result):
+            # Ignore if the user has moved on to another language or capture
+            if code != self.current_language or source != self.last_source_text:
+                return
+            self._show_result(source, result)
+
+        def work():
+            # The cache lookup reads SQLite, so it stays off the Tk thread too
+            try:
+                result = self.translator.translate(source, code)
+            except Exception as e:
+                result = f"[Translation failed: {e}]"
+            self.root.after(0, lambda: done(result))
+
+        threading.Thread(target=work, daemon=True).start()
+
+    def _speculate(self, source):
+        """Translate source into the other recently used languages in the background (cache warm-up)."""
+        if not SPECULATIVE_TRANSLATION or not source or source == self._speculated:
+            return
+        self._speculated = source
+        codes = [c for c in self.settings_manager.get("recent_languages", []) if c != self.current_language]
+
+        def work():
+            for code in codes:
+                self.translator.translate_async(source, code)
+
+        threading.Thread(target=work, daemon=True).start()
                 
     def _set_text(self, txt):
         self.textbox.configure(state="normal")
@@ -239,15 +360,53 @@ class LingoLiveApp:
     def _on_hotkey(self):
         """Hotkey - always start fresh selection."""
         if self.running:
-            self.root.after(10, self._new_selection)
+            self._sel_requested_at = time.perf_counter()
+            if self.text_source and not self.in_selection:
+                # Selected text first; runs off the Tk thread (it waits on the clipboard)
+                threading.Thread(target=self._text_first, daemon=True).start()
+                return
+            self.root.after(0, self._new_selection)
+            
+    def _text_first(self):
+        """Translate the selected text if there is any, else open the selector."""
+        text = None
+        try:
+            text = self.text_source.acquire()
+        except Exception as e:
+            print(f"[Text] Error: {e}")
+        if text:
+            self.root.after(0, lambda: self._translate_text(text))
+        else:
+            self.root.after(0, self._new_selection)
             
-    def _new_selection(self):
-        """Start fresh selection."""
+    def _translate_text(self, text):
+        """Translate text that needed no OCR."""
+        self._stop_tts()
+        self.root.deiconify()
+        self.root.lift()
+        self._set_text("⏳ Translating...")
+        self.status.configure(text="Translating...")
+        
+        def work():
+            try:
+                result = self.translator.translate(text, self.current_language)
+                self.root.after(0, lambda: self._show_result(text, result))
+            except Exception as e:
+                print(f"[Error] {e}")
+                msg = f"Error: {e}"
+                self.root.after(0, lambda m=msg: self._show_result("", m))
+        
+        threading.Thread(target=work, daemon=True).start()
+            
+    def _new_selection(self, frame=None):
+        """Start fresh selection (on a recalled `frame` if given)."""
         if not self.running:
             return
         
-        # Stop any ongoing TTS
+        # Stop any ongoing TTS and region watch
         self._stop_tts()
+        self._stop_watch()
+        self._stop_scroll()
             
         self._close_selection_window()
         if self.in_selection:
@@ -255,115 +414,177 @@ class LingoLiveApp:
             
         self.in_selection = True
         self._set_text("Starting new selection...")
+        was_visible = self.root.winfo_viewable()
         self.root.withdraw()
-        self.root.after(100, self._show_selector)
+        
+        if frame is not None:
+            self._show_selector(frame)
+            return
+        
+        # A window that was just visible may still be on screen until the
+        # compositor has unmapped it - give it the same 100ms the live
+        # selection always waited. A hidden window needs no wait.
+        delay = 100 if was_visible else 0
+        if FREEZE_FRAME:
+            # Grab the screen and select on the frozen frame
+            self.root.after(delay, lambda: self._show_selector(self._grab_frame()))
+        else:
+            self.root.after(delay, self._show_selector)
+        
+    def _grab_frame(self):
+        """Full-screen frame for freeze-frame selection (None if capture fails)."""
+        try:
+            frame = self.capture.grab_screen()
+            print(f"[Selection] Frozen frame: {frame.shape[1]}x{frame.shape[0]}")
+            return frame
+        except Exception as e:
+            print(f"[Selection] Freeze-frame capture failed, using live selection: {e}")
+            return None
         
     def _close_selection_window(self):
+        """Hide the selector (it is kept for the next selection)."""
         if self.selection_window:
             try:
                 self.selection_window.grab_release()
-                self.selection_window.destroy()
+                self.selection_window.withdraw()
+                self._sel_canvas.itemconfigure(self._sel_image, image='')
             except:
                 pass
-            self.selection_window = None
+        self._frozen_photo = None
+        self._sel_frame = None
+        
+    def _build_selector(self):
+        """
+        Build the full-screen selection overlay once, hidden. Each selection
+        only resets and shows it.
+        """
+        win = tk.Toplevel(self.root)
+        win.withdraw()
+        self.selection_window = win
+        
+        # Get actual screen dimensions
+        sw = win.winfo_screenwidth()
+        sh = win.winfo_screenheight()
+        self._sel_size = (sw, sh)
+        
+        # Make truly full screen
+        win.geometry(f"{sw}x{sh}+0+0")
+        win.overrideredirect(True)
+        win.attributes('-topmost', True)
+        win.configure(bg='#1a1a2e')
+        win.config(cursor='cross')
+        
+        # Create canvas filling entire screen
+        canvas = tk.Canvas(win, highlightthickness=0, bg='#1a1a2e')
+        canvas.pack(fill='both', expand=True)
+        self._sel_canvas = canvas
+        # Dimmed frozen screen goes here when freeze-frame is on
+        self._sel_image = canvas.create_image(0, 0, anchor='nw')
+        
+        # Instructions at top
+        canvas.create_text(sw//2, 50, text="🖱️ DRAG to select area for translation",
+                           font=("Arial", 24, "bold"), fill="#00ff00")
+        
+        # ESC button (visible cancel button)
+        esc_btn = tk.Button(win, text="✕ ESC to Cancel", font=("Arial", 14, "bold"),
+                           bg="#ff4444", fg="white", bd=0, padx=20, pady=10,
+                           command=lambda: on_escape(None))
+        esc_btn.place(x=sw-180, y=20)  # Top right corner
+        
+        # Selection state
+        self.sel_state = {"x1": 0, "y1": 0, "rect": None}
+        
+        def on_press(event):
+            print(f"[Selection] Press at ({event.x}, {event.y})")
+            self.sel_state["x1"] = event.x
+            self.sel_state["y1"] = event.y
+            if self.sel_state["rect"]:
+                canvas.delete(self.sel_state["rect"])
+            self.sel_state["rect"] = canvas.create_rectangle(
+                event.x, event.y, event.x, event.y,
+                outline='#00ff00', width=3
+            )
             
-    def _show_selector(self):
-        """Show full-screen selection overlay with ESC button."""
-        try:
-            print("[Selection] Creating full-screen selection window...")
+        def on_drag(event):
+            if self.sel_state["rect"]:
+                canvas.coords(self.sel_state["rect"], 
+                              self.sel_state["x1"], self.sel_state["y1"],
+                              event.x, event.y)
+                
+        def on_release(event):
+            print(f"[Selection] Release at ({event.x}, {event.y})")
+            x1 = min(self.sel_state["x1"], event.x)
+            y1 = min(self.sel_state["y1"], event.y)
+            x2 = max(self.sel_state["x1"], event.x)
+            y2 = max(self.sel_state["y1"], event.y)
+            frame = self._sel_frame
             
-            self.selection_window = tk.Toplevel()
-            win = self.selection_window
+            print(f"[Selection] Area: ({x1}, {y1}) to ({x2}, {y2})")
             
-            # Get actual screen dimensions
-            win.update_idletasks()
-            sw = win.winfo_screenwidth()
-            sh = win.winfo_screenheight()
-            print(f"[Selection] Screen: {sw}x{sh}")
+            # Close window
+            self._close_selection_window()
+            self.in_selection = False
             
-            # Make truly full screen
-            win.geometry(f"{sw}x{sh}+0+0")
-            win.overrideredirect(True)
-            win.attributes('-topmost', True)
-            win.attributes('-alpha', 0.3)
-            win.configure(bg='#1a1a2e')
-            win.config(cursor='cross')
-            
-            # Force the window to cover entire screen
-            win.wm_attributes('-topmost', 1)
-            win.state('zoomed')  # Maximize on Windows
-            
-            # Create canvas filling entire screen
-            canvas = tk.Canvas(win, highlightthickness=0, bg='#1a1a2e')
-            canvas.pack(fill='both', expand=True)
-            
-            # Instructions at top
-            canvas.create_text(sw//2, 50, text="🖱️ DRAG to select area for translation",
-                               font=("Arial", 24, "bold"), fill="#00ff00")
-            
-            # ESC button (visible cancel button)
-            esc_btn = tk.Button(win, text="✕ ESC to Cancel", font=("Arial", 14, "bold"),
-                               bg="#ff4444", fg="white", bd=0, padx=20, pady=10,
-                               command=lambda: on_escape(None))
-            esc_btn.place(x=sw-180, y=20)  # Top right corner
-            
-            # Selection state
-            self.sel_state = {"x1": 0, "y1": 0, "rect": None}
-            
-            def on_press(event):
-                print(f"[Selection] Press at ({event.x}, {event.y})")
-                self.sel_state["x1"] = event.x
-                self.sel_state["y1"] = event.y
-                if self.sel_state["rect"]:
-                    canvas.delete(self.sel_state["rect"])
-                self.sel_state["rect"] = canvas.create_rectangle(
-                    event.x, event.y, event.x, event.y,
-                    outline='#00ff00', width=3
-                )
-                
-            def on_drag(event):
-                if self.sel_state["rect"]:
-                    canvas.coords(self.sel_state["rect"], 
-                                  self.sel_state["x1"], self.sel_state["y1"],
-                                  event.x, event.y)
-                    
-            def on_release(event):
-                print(f"[Selection] Release at ({event.x}, {event.y})")
-                x1 = min(self.sel_state["x1"], event.x)
-                y1 = min(self.sel_state["y1"], event.y)
-                x2 = max(self.sel_state["x1"], event.x)
-                y2 = max(self.sel_state["y1"], event.y)
-                
-                print(f"[Selection] Area: ({x1}, {y1}) to ({x2}, {y2})")
-                
-                # Close window
-                self._close_selection_window()
-                self.in_selection = False
-                
-                # Translate if valid selection
-                if x2 - x1 > 10 and y2 - y1 > 10:
-                    self.root.after(200, lambda: self._translate(x1, y1, x2, y2))
-                else:
-                    print("[Selection] Too small, cancelling")
-                    self.root.after(0, self._show_main)
-                    
-            def on_escape(event):
-                print("[Selection] Cancelled")
-                self._close_selection_window()
-                self.in_selection = False
+            # Translate if valid selection
+            if x2 - x1 > 10 and y2 - y1 > 10 and frame is not None:
+                self.root.after(0, lambda: self._translate(x1, y1, x2, y2, frame))
+            elif x2 - x1 > 10 and y2 - y1 > 10:
+                self.root.after(200, lambda: self._translate(x1, y1, x2, y2))
+            else:
+                print("[Selection] Too small, cancelling")
                 self.root.after(0, self._show_main)
+                
+        def on_escape(event):
+            print("[Selection] Cancelled")
+            self._close_selection_window()
+            self.in_selection = False
+            self.root.after(0, self._show_main)
             
-            # Bind events
-            canvas.bind("<ButtonPress-1>", on_press)
-            canvas.bind("<B1-Motion>", on_drag)
-            canvas.bind("<ButtonRelease-1>", on_release)
-            win.bind("<Escape>", on_escape)
+        def on_expose(event):
+            if self._sel_requested_at is not None:
+                ms = (time.perf_counter() - self._sel_requested_at) * 1000
+                print(f"[Selection] Hotkey to crosshair: {ms:.0f}ms")
+                self._sel_requested_at = None
+        
+        # Bind events
+        canvas.bind("<ButtonPress-1>", on_press)
+        canvas.bind("<B1-Motion>", on_drag)
+        canvas.bind("<ButtonRelease-1>", on_release)
+        canvas.bind("<Expose>", on_expose)
+        win.bind("<Escape>", on_escape)
             
-            # Focus
-            win.focus_force()
-            win.lift()
+    def _show_selector(self, frame=None):
+        """
+        Show full-screen selection overlay with ESC button.
+        With a frozen `frame`, the selector draws over that image and the
+        selection is cropped from memory.
+        """
+        try:
+            if self._sel_requested_at is None:
+                self._sel_requested_at = time.perf_counter()
+            win = self.selection_window
+            sw, sh = self._sel_size
             
-            print("[Selection] Window ready")
+            # Reset
+            if self.sel_state["rect"]:
+                self._sel_canvas.delete(self.sel_state["rect"])
+                self.sel_state["rect"] = None
+            self._sel_frame = frame
+            if frame is not None:
+                # Dimmed frozen screen as the selection background
+                shown = self.capture.to_image(frame)
+                if shown.size != (sw, sh):
+                    shown = shown.resize((sw, sh))
+                self._frozen_photo = ImageTk.PhotoImage(ImageEnhance.Brightness(shown).enhance(0.6))
+            else:
+                self._frozen_photo = None
+            self._sel_canvas.itemconfigure(self._sel_image, image=self._frozen_photo or '')
+            win.attributes('-alpha', 1.0 if frame is not None else 0.3)
+            
+            win.deiconify()
+            win.attributes('-topmost', True)
+            win.lift()
+            win.focus_force()
             
         except Exception as e:
             print(f"[Selection Error] {e}")
@@ -378,8 +599,8 @@ class LingoLiveApp:
         self._set_text("Press Ctrl+Alt+T or click '📷 New' to select text")
         self.status.configure(text="Ctrl+Alt+T = New | ✕ = Hide | Quit = Exit")
         
-    def _translate(self, x1, y1, x2, y2):
-        """Capture and translate selected area."""
+    def _translate(self, x1, y1, x2, y2, frame=None):
+        """Capture and translate selected area (cropped from `frame` if frozen)."""
         print(f"[Translate] Capturing region: ({x1}, {y1}) to ({x2}, {y2})")
         
         self.root.deiconify()
@@ -387,22 +608,41 @@ class LingoLiveApp:
         self._set_text("⏳ Capturing...")
         self.status.configure(text="Capturing screen...")
         
+        if frame is not None:
+            # Screen coordinates -> frame pixels (differs under DPI scaling)
+            sx = frame.shape[1] / self.root.winfo_screenwidth()
+            sy = frame.shape[0] / self.root.winfo_screenheight()
+            self.last_region = (int(x1 * sx), int(y1 * sy),
+                                int(x2 * sx) - int(x1 * sx), int(y2 * sy) - int(y1 * sy))
+        else:
+            self.last_region = (x1, y1, x2 - x1, y2 - y1)
+        
         def work():
             try:
-                import time
-                # Extra delay to ensure selection window is completely gone
-                time.sleep(0.1)
-                
-                print(f"[Capture] Taking screenshot...")
-                img = ImageGrab.grab(bbox=(x1, y1, x2, y2))
+                if frame is not None and self.indexer and self._translate_indexed(frame, self.last_region):
+                    return
+                if frame is not None:
+                    img = self.capture.to_gray(frame[int(y1 * sy):int(y2 * sy), int(x1 * sx):int(x2 * sx)])
+                else:
+                    import time
+                    # Extra delay to ensure selection window is completely gone
+                    time.sleep(0.1)
+                    
+                    print(f"[Capture] Taking screenshot...")
+                    img = self.capture.capture_gray(x1, y1, x2 - x1, y2 - y1)
                 print(f"[Capture] Image size: {img.size}")
                 
                 # Update status
                 self.root.after(0, lambda: self._set_text("⏳ Extracting text..."))
                 self.root.after(0, lambda: self.status.configure(text="Running OCR..."))
                 
+                if STREAM_TRANSLATION:
+                    self._translate_stream(img)
+                    return
+                
                 text = self.ocr.extract_text(img)
                 print(f"[OCR] Extracted: '{text[:100] if text else 'EMPTY'}...'")
+                text = self._clean_ocr_text(text)
                 
                 if not text or not text.strip():
                     self.root.after(0, lambda: self._show_result("", "No text detected in selection.\n\nTry selecting a larger area with clear text."))
@@ -421,14 +661,347 @@ class LingoLiveApp:
                 import traceback
                 print(f"[Error] {e}")
                 traceback.print_exc()
-                self.root.after(0, lambda: self._show_result("", f"Error: {e}"))
+                msg = f"Error: {e}"
+                self.root.after(0, lambda m=msg: self._show_result("", m))
                 
         threading.Thread(target=work, daemon=True).start()
         
-    def _show_result(self, original, translated):
+    def _translate_indexed(self, frame, region):
+        """Answer the selection from the background screen index; False if it can't."""
+        x, y, w, h = region
+        hit = self.indexer.lookup(frame, (x, y, x + w, y + h))
+        if not hit:
+            return False
+        text, confidences = hit
+        if self.noise_gate:
+            text = self.noise_gate.clean(text, confidences)
+        if not text:
+            return False
+        print(f"[Index] Hit: '{text[:60]}' ({self.indexer.hits} hits / {self.indexer.misses} misses)")
+        result = self.translator.translate(text, self.current_language)
+        self.root.after(0, lambda: self._show_result(text, result))
+        return True
+        
+    def _toggle_watch(self):
+        """Start/stop watch mode on the last selected region."""
+        if self.watcher and self.watcher.running:
+            self._stop_watch()
+            self.status.configure(text="Watch stopped | Ctrl+Alt+T = New")
+            return
+        if not self.last_region:
+            self.status.configure(text="Select a region first, then 👁 to watch it")
+            return
+        
+        from services.region_watcher import RegionWatcher
+        self._watch_text = ""
+        self.watcher = RegionWatcher(self.capture, self.last_region, self._on_watch_change,
+                                     WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL,
+                                     WATCH_CHANGE_THRESHOLD, WATCH_DEBOUNCE)
+        self.watcher.start()
+        self.watch_btn.configure(fg_color="#4CAF50")
+        self.status.configure(text="👁 Watching region | 👁 = Stop")
+        
+    def _stop_watch(self):
+        if self.watcher:
+            self.watcher.stop()
+            self.watcher = None
+            try:
+                self.watch_btn.configure(fg_color="transparent")
+            except:
+                pass
+        
+    def _on_watch_change(self, img):
+        """Watcher thread: the region settled on new content."""
+        text = self._clean_ocr_text(self.ocr.extract_text(img))
+        if not text or text == self._watch_text:
+            return
+        self._watch_text = text
+        result = self.translator.translate(text, self.current_language)
+        print(f"[Watch] '{text[:50]}' -> '{result[:50] if result else ''}'")
+        self.root.after(0, lambda: self._show_result(text, result))
+        
+    def _toggle_scroll(self):
+        """Start/stop scrolling capture on the last selected region."""
+        if self.scroller:
+            self._stop_scroll()
+            return
+        if not self.last_region:
+            self.status.configure(text="Select a region first, then 📜 and scroll it")
+            return
+        
+        from services.region_watcher import RegionWatcher
+        from services.scroll_stitcher import ScrollStitcher
+        stitcher = ScrollStitcher()
+        watcher = RegionWatcher(self.capture, self.last_region,
+                                lambda img: self._on_scroll_frame(stitcher, img),
+                                WATCH_MIN_INTERVAL, WATCH_MAX_INTERVAL,
+                                WATCH_CHANGE_THRESHOLD, WATCH_DEBOUNCE)
+        self.scroller = (watcher, stitcher)
+        self._scroll_parts = ([], [])
+        watcher.start()
+        self.scroll_btn.configure(fg_color="#8BC34A")
+        self.status.configure(text="📜 Scroll the region - only new lines are translated | 📜 = Stop")
+        
+    def _stop_scroll(self, flush=True):
+        if not self.scroller:
+            return
+        watcher, stitcher = self.scroller
+        self.scroller = None
+        try:
+            self.scroll_btn.configure(fg_color="transparent")
+        except:
+            pass
+        if not flush:
+            watcher.stop()
+            return
+
+        def finish():
+            # The watcher thread may still be stitching - let it finish first
+            watcher.stop(wait=True)
+            # Whatever was held back at the bottom edge is complete now
+            self._translate_scroll_piece(stitcher.take_lines(final=True), final=True)
+        threading.Thread(target=finish, daemon=True).start()
+        
+    def _on_scroll_frame(self, stitcher, img):
+        """Watcher thread: stitch the settled frame and translate the new strip."""
+        rows = stitcher.add(np.asarray(img))
+        if rows:
+            print(f"[Scroll] +{rows} rows")
+            self._translate_scroll_piece(stitcher.take_lines())
+        
+    def _translate_scroll_piece(self, piece, final=False):
+        """Translate a new strip; the final one also warms other languages (speculation)."""
+        originals, translations = self._scroll_parts
+        text = self._clean_ocr_text(self.ocr.extract_text(piece)) if piece is not None else ""
+        if text:
+            originals.append(text)
+            translations.append(self.translator.translate(text, self.current_language))
+        elif not (final and originals):
+            return
+        original, translated = '\n'.join(originals), '\n'.join(translations)
+        self.root.after(0, lambda: self._show_result(original, translated, speculate=final))
+        
+    def _save_preset(self):
+        """Save the last selected region as a named preset bound to the next free hotkey."""
+        if not self.last_region:
+            self.status.configure(text="Select a region first, then 📌 to pin it")
+            return
+        name = ctk.CTkInputDialog(text="Name for this region:", title="📌 Pin region").get_input()
+        if not name or not name.strip():
+            return
+        name = name.strip()
+        hotkey = self.presets.next_hotkey()
+        self.presets.add(name, self.last_region, hotkey)
+        if hotkey:
+            self._bind_preset(name, hotkey)
+        self.status.configure(text=f"📌 '{name}' = {hotkey or 'no free hotkey'}")
+        
+    def _bind_preset(self, name, hotkey):
+        try:
+            keyboard.add_hotkey(hotkey, lambda: self.root.after(0, lambda: self._capture_preset(name)),
+                                suppress=False)
+        except Exception as e:
+            print(f"[Regions] Error binding {hotkey}: {e}")
+        
+    def _capture_preset(self, name):
+        """Capture and translate a preset region straight away - no selector."""
+        preset = self.presets.presets.get(name)
+        if not preset or not self.running:
+            return
+        x, y, w, h = preset["region"]
+        self.last_region = (x, y, w, h)
+        self.status.configure(text=f"📌 {name}...")
+        # Keep the window out of the capture: hide it and give the compositor
+        # the same 100ms as a new selection, then bring it back once grabbed
+        delay = 100 if self.root.winfo_viewable() else 0
+        self.root.withdraw()
+        
+        def work():
+            try:
+                try:
+                    img = self.capture.capture_gray(x, y, w, h)
+                finally:
+                    self.root.after(0, lambda: (self.root.deiconify(), self.root.lift()))
+                text = self._clean_ocr_text(self.presets.recognize(name, img))
+                if not text:
+                    self.root.after(0, lambda: self._show_result("", f"No text in '{name}'."))
+                    return
+                result = self.translator.translate(text, self.current_language)
+                self.root.after(0, lambda: self._show_result(text, result))
+            except Exception as e:
+                print(f"[Error] {e}")
+                msg = f"Error: {e}"
+                self.root.after(0, lambda m=msg: self._show_result("", m))
+        
+        self.root.after(delay, lambda: threading.Thread(target=work, daemon=True).start())
+        
+    def _start_recorder(self):
+        if self.recorder and self.recorder.running:
+            return
+        from services.frame_recorder import FrameRecorder
+        self.recorder = FrameRecorder(self.capture, RECORDER_SECONDS, RECORDER_INTERVAL,
+                                      RECORDER_MAX_MB * 1024 * 1024, RECORDER_SCALE)
+        self.recorder.start()
+        
+    def _recall(self):
+        """Translate what was just there: pick a recent frame, then select on it."""
+        if not self.recorder or not self.recorder.running:
+            self._start_recorder()
+            self.status.configure(text="⏪ Recording the last few seconds - ⏪ again to look back")
+            return
+        
+        self.recorder.pause()
+        stamps = self.recorder.timestamps()
+        if not stamps:
+            self.recorder.resume()
+            self.status.configure(text="⏪ Nothing recorded yet")
+            return
+        self._show_recall_picker(stamps)
+        
+    def _show_recall_picker(self, stamps):
+        """Slider over the buffered frames with a preview; newest frame preselected."""
+        win = ctk.CTkToplevel(self.root)
+        win.title("⏪ Recent screen")
+        win.attributes('-topmost', True)
+        
+        preview = tk.Label(win, bg="#1a1a2e")
+        preview.pack(padx=10, pady=(10, 5))
+        label = ctk.CTkLabel(win, text="")
+        label.pack()
+        
+        def show(value):
+            index = min(int(round(float(value))), len(stamps) - 1)
+            thumb = self.capture.to_image(self.recorder.frame(index))
+            thumb.thumbnail((560, 320))
+            self._recall_photo = ImageTk.PhotoImage(thumb)
+            preview.configure(image=self._recall_photo)
+            label.configure(text=f"{time.time() - stamps[index]:.1f}s ago")
+        
+        slider = ctk.CTkSlider(win, from_=0, to=max(1, len(stamps) - 1),
+                               number_of_steps=max(1, len(stamps) - 1), command=show)
+        slider.set(len(stamps) - 1)
+        slider.pack(fill="x", padx=10, pady=5)
+        if len(stamps) == 1:
+            # A slider needs a range - with one frame there is nothing to pick
+            slider.configure(state="disabled")
+        
+        def close():
+            win.destroy()
+            self._recall_photo = None
+            self.recorder.resume()
+        
+        def select():
+            index = min(int(round(slider.get())), len(stamps) - 1)
+            frame = self.recorder.frame(index)
+            close()
+            self._new_selection(frame)
+        
+        buttons = ctk.CTkFrame(win, fg_color="transparent")
+        buttons.pack(pady=(5, 10))
+        ctk.CTkButton(buttons, text="Select region", command=select).pack(side="left", padx=5)
+        ctk.CTkButton(buttons, text="Cancel", fg_color="transparent", border_width=1,
+                      command=close).pack(side="left", padx=5)
+        win.protocol("WM_DELETE_WINDOW", close)
+        show(len(stamps) - 1)
+        
+    def _track_window(self, e=None):
+        try:
+            self._window_rect = (self.root.winfo_rootx(), self.root.winfo_rooty(),
+                                 self.root.winfo_width(), self.root.winfo_height())
+        except:
+            pass
+        
+    def _over_window(self, x, y):
+        """Hover thread: is the pointer over our own (visible) window?"""
+        rect = self._window_rect
+        if not rect:
+            return False
+        wx, wy, ww, wh = rect
+        return wx <= x < wx + ww and wy <= y < wy + wh
+        
+    def _toggle_hover(self):
+        """Start/stop hover translation."""
+        if self.hover and self.hover.running:
+            self._stop_hover()
+            self.status.configure(text="Hover stopped | Ctrl+Alt+T = New")
+            return
+        
+        from services.hover_translator import HoverTranslator
+        self._track_window()
+        self.hover = HoverTranslator(self.capture, self._hover_process, self._on_hover_result,
+                                     CAPTURE_WIDTH, CAPTURE_HEIGHT, HOVER_DWELL,
+                                     move_tolerance=HOVER_MOVE_TOLERANCE,
+                                     cache_size=HOVER_CACHE_SIZE, ignore=self._over_window)
+        self.hover.start()
+        self.hover_btn.configure(fg_color="#FF9800")
+        self.status.configure(text="🖱 Rest the pointer on text to translate | 🖱 = Stop")
+        
+    def _stop_hover(self):
+        if self.hover:
+            self.hover.stop()
+            self.hover = None
+            try:
+                self.hover_btn.configure(fg_color="transparent")
+            except:
+                pass
+        
+    def _hover_process(self, img, cancelled):
+        """Hover worker: OCR then translate, bailing out once the pointer has moved."""
+        text = self._clean_ocr_text(self.ocr.extract_text(img))
+        if not text or cancelled():
+            return None
+        return text, self.translator.translate(text, self.current_language)
+        
+    def _on_hover_result(self, text, result):
+        def show():
+            if self.root.state() == 'withdrawn':
+                self.root.deiconify()
+            self._show_result(text, result)
+        self.root.after(0, show)
+        
+    def _clean_ocr_text(self, text):
+        """Drop OCR junk so noise never reaches the translation API."""
+        if not text or not self.noise_gate:
+            return text
+        # Confidences travel with the OCR text (OCRText) - no shared state between capture threads
+        cleaned = self.noise_gate.clean(text, getattr(text, 'confidences', None))
+        if cleaned != text:
+            print(f"[Noise Gate] '{text[:60]}' -> '{cleaned[:60]}'")
+        return cleaned
+        
+    def _translate_stream(self, img):
+        """OCR and translate paragraph by paragraph, filling in the result as each arrives."""
+        originals, translations = [], []
+        for chunk in self.ocr.iter_text(img):
+            chunk = self._clean_ocr_text(chunk)
+            if not chunk:
+                continue
+            originals.append(chunk)
+            translations.append(self.translator.translate(chunk, self.current_language))
+            print(f"[Trans] Part {len(translations)}: '{translations[-1][:50]}...'")
+            original, translated = '\n'.join(originals), '\n'.join(translations)
+            self.root.after(0, lambda o=original, t=translated: self._show_partial(o, t))
+        
+        if not originals:
+            self.root.after(0, lambda: self._show_result("", "No text detected in selection.\n\nTry selecting a larger area with clear text."))
+            return
+        
+        original, translated = '\n'.join(originals), '\n'.join(translations)
+        self.root.after(0, lambda: self._show_result(original, translated))
+        
+    def _show_partial(self, original, translated):
+        """Show the paragraphs translated so far while the rest is still processing."""
+        self._set_text(f"📝 Original:\n{original}\n\n🌐 Translation:\n{translated}\n⏳ ...")
+        self.status.configure(text="⏳ Translating...")
+        
+    def _show_result(self, original, translated, speculate=True):
         # Store translated text for TTS
         self.last_translated_text = translated or ""
         print(f"[TTS Storage] Stored for TTS: '{self.last_translated_text}'")
+        if original:
+            self.last_source_text = original
+            if speculate:
+                self._speculate(original)
         
         # Always show both if we have original text, even if they are the same
         if original:
@@ -468,21 +1041,22 @@ class LingoLiveApp:
         # Disable button to prevent spam
         self.summarize_btn.configure(state="disabled")
         
-        def work():
-            try:
-                # Get full language name for better prompting
-                from config import SUPPORTED_LANGUAGES
-                lang_name = SUPPORTED_LANGUAGES.get(self.current_language, "English")
-                
-                summary = self.gemini.summarize(self.last_translated_text, target_language=lang_name)
-                self.root.after(0, lambda: self._show_summary(summary))
-            except Exception as e:
-                print(f"[Summarize Error] {e}")
-                self.root.after(0, lambda: self._set_text(f"Summarization failed: {e}"))
-            finally:
-                self.root.after(0, lambda: self.summarize_btn.configure(state="normal"))
-                
-        threading.Thread(target=work, daemon=True).start()
+        # Get full language name for better prompting
+        from config import SUPPORTED_LANGUAGES
+        lang_name = SUPPORTED_LANGUAGES.get(self.current_language, "English")
+
+        def done(summary, error):
+            self.summarize_btn.configure(state="normal")
+            if error:
+                print(f"[Summarize Error] {error}")
+                self._set_text(f"Summarization failed: {error}")
+            else:
+                self._show_summary(summary)
+
+        # Runs on the network loop; the UI is never blocked
+        from services.network_runtime import NetworkRuntime
+        NetworkRuntime.then(self.gemini.summarize_async(self.last_translated_text, target_language=lang_name),
+                            self.root, done)
         
     def _show_summary(self, summary):
         """Append summary to text box."""
@@ -499,9 +1073,7 @@ class LingoLiveApp:
 
     def _open_settings(self):
         """Open settings window."""
-        if self.selection_window:
-            self.selection_window.destroy()
-            self.selection_window = None
+        self._close_selection_window()
             
         print("[Settings] Opening window...")
         sw = ctk.CTkToplevel(self.root)
@@ -700,9 +1272,9 @@ class LingoLiveApp:
         # Run TTS in background thread
         def speak_text(text, lang):
             try:
-                import asyncio
                 import edge_tts
                 import pygame
+                from services.network_runtime import NetworkRuntime
                 import os
                 import tempfile
                 
@@ -746,7 +1318,8 @@ class LingoLiveApp:
                     communicate = edge_tts.Communicate(text, voice)
                     await communicate.save(temp_file)
                 
-                asyncio.run(generate())
+                # On the shared network loop instead of a new loop per request
+                NetworkRuntime.get().run(generate())
                 
                 if not os.path.exists(temp_file):
                     print("[TTS] Failed to generate audio file")
@@ -808,6 +1381,27 @@ class LingoLiveApp:
         except:
             pass
         self._close_selection_window()
+        self._stop_watch()
+        self._stop_hover()
+        self._stop_scroll(flush=False)
+        if self.recorder:
+            self.recorder.stop()
+        if self.indexer:
+            self.indexer.stop()
+        try:
+            self.ocr.close()
+        except:
+            pass
+        try:
+            self.capture.close()
+        except:
+            pass
+        try:
+            self.translator.close()
+        except:
+            pass
+        from services.network_runtime import NetworkRuntime
+        NetworkRuntime.shutdown()
         release_lock()
         
     def _exit_app(self):
@@ -839,6 +1433,25 @@ class LingoLiveApp:
         keyboard.add_hotkey(hotkey, self._on_hotkey, suppress=False)
         print(f"  ✅ Hotkey active: {hotkey}")
         
+        for name, preset in self.presets.presets.items():
+            if preset.get("hotkey"):
+                self._bind_preset(name, preset["hotkey"])
+                print(f"  📌 {name}: {preset['hotkey']}")
+        
+        keyboard.add_hotkey(RECALL_HOTKEY, lambda: self.root.after(10, self._recall), suppress=False)
+        if RECORDER_ENABLED:
+            self._start_recorder()
+            print(f"  ✅ Recording last {RECORDER_SECONDS}s ({RECALL_HOTKEY} to look back)")
+        
+        if SCREEN_INDEX:
+            from services.screen_index import ScreenIndexer
+            self.indexer = ScreenIndexer(self.capture, self.ocr, SCREEN_INDEX_INTERVAL,
+                                         SCREEN_INDEX_CELL,
+                                         skip=lambda: self.in_selection or self.watcher or self.scroller,
+                                         lang=self.ocr.languages(SCREEN_INDEX_LANGS or OCR_CANDIDATE_LANGS),
+                                         min_gap=SCREEN_INDEX_MIN_GAP)
+            self.indexer.start()
+        
         # Apply opacity from settings
         opacity = self.settings_manager.get("opacity", OVERLAY_OPACITY)
         self.root.attributes('-alpha', opacity)
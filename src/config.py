@@ -50,3 +50,174 @@ OVERLAY_FONT_SIZE = 14
 
 # Tesseract path (set to None to use system PATH, or provide full path)
 TESSERACT_CMD = r"C:\Program Files\Tesseract-OCR\tesseract.exe"
+
+# OCR engine pool (requires the optional `tesserocr` package).
+# Keeps long-lived Tesseract engines with their language models loaded,
+# so a capture doesn't pay for process startup and traineddata loading.
+OCR_ENGINE_POOL = True
+# Engines kept per language set (None = one per CPU core)
+OCR_POOL_SIZE = None
+# Engines kept across all language sets, per pool; idle engines of the least
+# recently used sets are ended beyond this (None = 2 x OCR_POOL_SIZE)
+OCR_POOL_MAX_ENGINES = None
+# Tessdata folder for the pool (None = TESSDATA_PREFIX or next to TESSERACT_CMD)
+TESSDATA_DIR = None
+
+# Script detection: run Tesseract OSD first and load only the traineddata for
+# the detected script instead of every installed language (needs
+# osd.traineddata and the engine pool - without the pool OSD would cost an
+# extra tesseract process per capture, so it is skipped)
+OCR_DETECT_SCRIPT = True
+# Minimum OSD script confidence to trust the detected script
+OCR_SCRIPT_MIN_CONF = 2.0
+# Languages tried in parallel when detection is unsure (best mean confidence wins)
+OCR_CANDIDATE_LANGS = ['eng', 'jpn']
+# Latin-script languages read together, so accented letters survive
+OCR_LATIN_LANGS = ['eng', 'fra', 'deu', 'spa', 'por', 'ita']
+# Tesseract script name -> traineddata files to load (installed ones only)
+OCR_SCRIPT_LANGS = {
+    'Latin': OCR_LATIN_LANGS,
+    'Japanese': ['jpn'],
+    'Katakana': ['jpn'],
+    'Hiragana': ['jpn'],
+    'Han': ['chi_sim', 'jpn'],
+    'HanS': ['chi_sim'],
+    'HanT': ['chi_tra'],
+    'Hangul': ['kor'],
+    'Korean': ['kor'],
+    'Cyrillic': ['rus'],
+    'Arabic': ['ara'],
+    'Devanagari': ['hin'],
+}
+
+# OCR result cache - re-capturing the same region skips Tesseract (0 disables)
+OCR_CACHE_SIZE = 256
+# Optional on-disk store that survives restarts (None = memory only)
+OCR_CACHE_FILE = None
+
+# OCR preprocessing: 'basic' (grayscale + contrast) or 'adaptive' (NumPy
+# pipeline: x-height rescaling, auto-invert, deskew, local thresholding).
+# Compare both with benchmarks/preprocess_benchmark.py
+OCR_PREPROCESS_MODE = 'basic'
+# Text x-height (px) the adaptive pipeline rescales to
+OCR_TARGET_X_HEIGHT = 22
+
+# Skip OCR for blank selections and crop to the text bounding box first
+OCR_CROP_TO_TEXT = True
+
+# Captures at least this many pixels are split into line bands and OCR'd in
+# parallel; smaller captures use a single Tesseract call
+OCR_PARALLEL_MIN_PIXELS = 600_000
+# Parallel OCR workers (None = one per CPU core)
+OCR_PARALLEL_WORKERS = None
+
+# Show the translation paragraph by paragraph as OCR produces it
+STREAM_TRANSLATION = True
+
+# Two-pass OCR: a cheap first pass (fast models, psm from the region's shape,
+# no preprocessing); only lines below OCR_MIN_CONFIDENCE (0-100) are re-run
+# with the default (best) models and adaptive preprocessing
+OCR_TWO_PASS = False
+OCR_MIN_CONFIDENCE = 70
+# tessdata_fast folder for the first pass (None = use the default models)
+TESSDATA_FAST_DIR = None
+
+# Incremental OCR: cache text per text-line strip so re-captures and scrolled
+# captures only OCR the lines that are new or changed
+OCR_INCREMENTAL = True
+OCR_LINE_CACHE_SIZE = 2048
+
+# Drop OCR junk (icon/chart fragments) before translation; skip the API call
+# when nothing meaningful is left
+NOISE_GATE = True
+# Words below this OCR confidence (0-100) are dropped when confidences are known
+NOISE_MIN_WORD_CONF = 40
+
+# Freeze-frame selection: grab the screen at hotkey time, draw the selector
+# over that frame and crop from memory (no waiting for the selector to close)
+FREEZE_FRAME = True
+
+# Watch mode: re-translate a pinned region whenever its content changes.
+# Sampling starts at WATCH_MIN_INTERVAL seconds and backs off to
+# WATCH_MAX_INTERVAL while the region is static
+WATCH_MIN_INTERVAL = 0.1
+WATCH_MAX_INTERVAL = 1.0
+# Fraction of pixels that must change to count as new content (a change
+# within a text row, e.g. one digit, always counts)
+WATCH_CHANGE_THRESHOLD = 0.01
+# Stable samples required before OCR (skips fade-in/out frames)
+WATCH_DEBOUNCE = 2
+
+# Hover mode: translate the text line under the pointer after it rests for
+# HOVER_DWELL seconds (captures CAPTURE_WIDTH x CAPTURE_HEIGHT around it)
+HOVER_DWELL = 0.5
+# Pointer movement (px) still treated as resting
+HOVER_MOVE_TOLERANCE = 6
+# Recent hover results reused for an unchanged region
+HOVER_CACHE_SIZE = 64
+
+# Retroactive capture: keep the last RECORDER_SECONDS of the screen in memory
+# (compressed grayscale, capped at RECORDER_MAX_MB) so text that already
+# disappeared can still be selected. ⏪ / RECALL_HOTKEY picks a past frame
+RECORDER_ENABLED = False
+RECORDER_SECONDS = 10
+RECORDER_INTERVAL = 1.0
+RECORDER_MAX_MB = 48
+# Keep every Nth pixel (1 = full resolution, best for OCR)
+RECORDER_SCALE = 1
+RECALL_HOTKEY = 'ctrl+alt+r'
+
+# Predictive OCR: OCR the whole screen in the background while idle and
+# answer selections on an unchanged screen from the word index (no OCR).
+# Checks for changes every SCREEN_INDEX_INTERVAL seconds
+SCREEN_INDEX = False
+SCREEN_INDEX_INTERVAL = 5.0
+# Grid cell size (px) of the word index
+SCREEN_INDEX_CELL = 64
+# Languages for the background scans (None = OCR_CANDIDATE_LANGS); every
+# extra traineddata makes the full-screen pass slower
+SCREEN_INDEX_LANGS = None
+# Minimum seconds between two background scans
+SCREEN_INDEX_MIN_GAP = 30.0
+
+# Text-first capture (opt-in): on the hotkey, use the selected text itself
+# (X11 primary selection on Linux, otherwise a copy to the clipboard) and skip
+# the selector and OCR; falls back to screen capture when there is no fresh
+# text. Any selection made since the last hotkey counts, even an old one
+TEXT_FIRST = False
+# Also send the copy shortcut to the focused app (Windows/macOS). The
+# clipboard text is restored afterwards and console windows are skipped
+TEXT_FIRST_COPY = False
+# Max seconds to wait for selected text before falling back to OCR
+TEXT_FIRST_TIMEOUT = 0.25
+
+# Region presets: named screen regions captured with their own hotkey (no
+# selector). Each learns its best OCR profile over its first
+# REGION_TUNING_RUNS captures
+REGION_PRESETS_FILE = "regions.json"
+REGION_TUNING_RUNS = 3
+
+# Translation cache: in-memory LRU in front of a SQLite file, keyed by the
+# normalized text, target language and provider
+TRANSLATION_CACHE = True
+TRANSLATION_CACHE_FILE = "translations.db"
+TRANSLATION_CACHE_MEMORY = 512      # Entries kept in memory
+TRANSLATION_CACHE_TTL_DAYS = 30
+TRANSLATION_CACHE_MAX_ROWS = 20000  # Least recently used rows dropped beyond this
+
+# Language switching re-translates the last text (cache first, no re-OCR).
+# Speculative translation also translates each capture into the
+# SPECULATIVE_LANGUAGES most recently used other languages in the background,
+# so switching to them is instant (costs extra API calls)
+SPECULATIVE_TRANSLATION = False
+SPECULATIVE_LANGUAGES = 2
+
+# Hedged requests: if Lingo.dev has not answered within the HEDGE_PERCENTILE
+# of its recent latency, the same request also goes to Google and the first
+# answer wins. HEDGE_DEFAULT_DELAY is used until enough samples are in
+HEDGED_REQUESTS = True
+HEDGE_PERCENTILE = 90
+HEDGE_DEFAULT_DELAY = 1.0   # seconds
+HEDGE_MIN_DELAY = 0.2
+HEDGE_MAX_DELAY = 3.0
+HEDGE_WINDOW = 50           # Latest latencies kept per provider
@@ -2,7 +2,9 @@
 Main Controller for Lingo-Live - Optimized
 """
 
+import itertools
 import threading
+import time
 import sys
 import os
 from dotenv import load_dotenv
@@ -12,12 +14,14 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 import keyboard
+from services.capture_service import ScreenCaptureService
 from services.ocr_service import OCRService
 from services.translation_service import TranslationService
 from services.gemini_service import GeminiService
+from services.network_runtime import NetworkRuntime
 from ui.overlay import OverlayWindow
 from ui.screen_selector import ScreenSelector
-from config import DEFAULT_TARGET_LANGUAGE
+from config import DEFAULT_TARGET_LANGUAGE, TEXT_FIRST, TEXT_FIRST_COPY, TEXT_FIRST_TIMEOUT
 
 HOTKEY = 'ctrl+alt+t'
 
@@ -26,37 +30,66 @@ class LingoLiveController:
     """Optimized controller."""
 
     def __init__(self):
+        self.capture = ScreenCaptureService()
         self.ocr = OCRService()
         self.translator = TranslationService()
         self.gemini = GeminiService()
         self.overlay = None
+        self.selector = ScreenSelector(on_selection_complete=self._on_selected,
+                                       capture=self.capture)
         self._selecting = False
         self.last_translated_text = None
+        self.last_source = None   # (text, pos) of the last translation
+        self._requests = itertools.count(1)
+        self._latest_request = 0   # Only the newest translation may update the overlay
+        self.text_source = None
+        if TEXT_FIRST:
+            from services.text_source import TextSource
+            self.text_source = TextSource(TEXT_FIRST_TIMEOUT, TEXT_FIRST_COPY)
 
     def _on_lang_change(self, code):
         self.translator.set_target_language(code)
+        # Show the last text in the new language right away (cache first, no re-OCR)
+        if self.last_source:
+            threading.Thread(target=self._translate_text, args=self.last_source, daemon=True).start()
+
+    def _on_hotkey(self):
+        """Hotkey: translate selected text directly if there is any, else select a region."""
+        if not self.text_source:
+            self._start_new()
+            return
+        
+        def work():
+            text = self.text_source.acquire()
+            if text:
+                self._translate_text(text, None)
+            else:
+                self._start_new()
+        threading.Thread(target=work, daemon=True).start()
 
     def _start_new(self):
         """Start new translation - hide overlay first."""
-        if self._selecting:
+        if self._selecting or not self.overlay:
             return
         self._selecting = True
         
-        # Hide overlay
-        if self.overlay:
-            self.overlay.schedule_action(self.overlay.hide)
-        
-        # Start selection after small delay
-        threading.Thread(target=self._select, daemon=True).start()
+        # Selection runs on the overlay's Tk thread with the pre-built selector
+        self.overlay.schedule_action(self._select, time.perf_counter())
 
-    def _select(self):
-        """Run selection."""
-        import time
-        time.sleep(0.1)  # Wait for overlay to hide
-        
+    def _select(self, requested_at):
+        """Hide overlay and show the selector (Tk thread)."""
+        try:
+            was_visible = self.overlay.is_visible()
+            self.overlay.hide()
+            # Let the compositor unmap the overlay before a freeze frame is grabbed
+            self.selector.root.after(100 if was_visible else 0, self._show_selector, requested_at)
+        except Exception as e:
+            print(f"[Error] {e}")
+            self._selecting = False
+
+    def _show_selector(self, requested_at):
         try:
-            selector = ScreenSelector(on_selection_complete=self._on_selected)
-            selector.start_selection()
+            self.selector.show(requested_at)
         except Exception as e:
             print(f"[Error] {e}")
         finally:
@@ -80,14 +113,29 @@ class LingoLiveController:
                 return
             
             print(f"[OCR] {text[:50]}...")
-            
+            self._translate_text(text, pos)
+                
+        except Exception as e:
+            print(f"[Error] {e}")
+            if self.overlay:
+                self.overlay.schedule_action(self.overlay.show_error, str(e))
+
+    def _translate_text(self, text, pos):
+        """Translate text (from OCR or the selection) and show it."""
+        request = self._latest_request = next(self._requests)
+        try:
             # Translate
             lang = self.overlay.get_current_language() if self.overlay else DEFAULT_TARGET_LANGUAGE
             result = self.translator.translate(text, lang)
             
+            # A newer capture or language switch has started since - drop this one
+            if request != self._latest_request:
+                print(f"[Trans] Dropped stale {lang} result")
+                return
             print(f"[Trans] {result[:50]}...")
             
             self.last_translated_text = result
+            self.last_source = (text, pos)
             
             if self.overlay:
                 self.overlay.schedule_action(self.overlay.show_text, text, result, pos)
@@ -149,13 +197,14 @@ class LingoLiveController:
         else:
             print("  ⚠️ Gemini not available")
 
-        keyboard.add_hotkey(HOTKEY, self._start_new, suppress=False)
+        keyboard.add_hotkey(HOTKEY, self._on_hotkey, suppress=False)
         keyboard.add_hotkey('escape', self._exit_app, suppress=False)
         
         self.overlay = OverlayWindow(
             on_language_change=self._on_lang_change,
             on_new_translation=self._start_new,
-            on_summarize_click=self._summarize_click
+            on_summarize_click=self._summarize_click,
+            on_ready=self.selector.build
         )
         
         try:
@@ -164,6 +213,9 @@ class LingoLiveController:
             pass
         finally:
             keyboard.unhook_all()
+            self.translator.close()
+            self.capture.close()
+            NetworkRuntime.shutdown()
             print("[Done]")
 
 
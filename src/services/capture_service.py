@@ -3,8 +3,12 @@ Screen Capture Service for Lingo-Live
 Uses MSS for fast, cross-platform screen capture.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import mss
 import mss.tools
+import numpy as np
 from PIL import Image
 from pynput import mouse
 
@@ -15,75 +19,125 @@ class ScreenCaptureService:
     """
 
     def __init__(self):
-        # Don't create MSS instance here - create per-thread when needed
-        pass
+        # MSS handles (GDI DCs on Windows) are bound to the thread that created
+        # them and are not freed by the garbage collector. Every grab runs on
+        # one long-lived capture thread that owns the single handle, so
+        # short-lived worker threads never leak one.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+        self._thread = None
+        self._sct_handle = None
+        self._mouse = None
+
+    def _sct(self):
+        """Persistent MSS instance (capture thread only)."""
+        if self._sct_handle is None:
+            self._sct_handle = mss.mss()
+            self._thread = threading.current_thread()
+        return self._sct_handle
+
+    def _on_capture_thread(self, fn, *args):
+        """Run fn on the capture thread and return its result."""
+        if threading.current_thread() is self._thread:
+            return fn(*args)
+        return self._executor.submit(fn, *args).result()
 
     def get_mouse_position(self) -> tuple[int, int]:
         """
         Get the current mouse cursor position.
-        
+
         Returns:
             Tuple of (x, y) coordinates.
         """
-        return mouse.Controller().position
+        if self._mouse is None:
+            self._mouse = mouse.Controller()
+        return self._mouse.position
+
+    def grab(self, x: int, y: int, width: int, height: int) -> np.ndarray:
+        """
+        Capture a region as raw pixels.
+
+        Returns:
+            (height, width, 4) uint8 BGRA array - a view of the MSS buffer, no copy.
+        """
+        monitor = {"top": y, "left": x, "width": width, "height": height}
+        shot = self._on_capture_thread(lambda: self._sct().grab(monitor))
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    def grab_screen(self, monitor: int = 1) -> np.ndarray:
+        """Capture a whole monitor (1 = primary) as a BGRA array."""
+        shot = self._on_capture_thread(lambda: self._sct().grab(self._sct().monitors[monitor]))
+        return np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+    @staticmethod
+    def to_gray(bgra: np.ndarray) -> Image.Image:
+        """BGRA pixels straight to a grayscale image for OCR (BT.601 luma, no RGB step)."""
+        if bgra.ndim == 2:
+            return Image.fromarray(np.ascontiguousarray(bgra), 'L')
+        b = bgra[..., 0].astype(np.uint16)
+        g = bgra[..., 1].astype(np.uint16)
+        r = bgra[..., 2].astype(np.uint16)
+        gray = (r * 77 + g * 150 + b * 29) >> 8
+        return Image.fromarray(gray.astype(np.uint8), 'L')
+
+    @staticmethod
+    def to_image(bgra: np.ndarray) -> Image.Image:
+        """BGRA (or already grayscale) pixels to an RGB image (for display)."""
+        if bgra.ndim == 2:
+            return Image.fromarray(np.ascontiguousarray(bgra), 'L').convert('RGB')
+        h, w = bgra.shape[:2]
+        return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(bgra), "raw", "BGRX", 0, 1)
+
+    def capture_gray(self, x: int, y: int, width: int, height: int) -> Image.Image:
+        """Capture a region as a grayscale image ready for OCR preprocessing."""
+        return self.to_gray(self.grab(x, y, width, height))
 
     def capture_region(self, x: int, y: int, width: int, height: int) -> Image.Image:
         """
         Capture a region of the screen.
-        
+
         Args:
             x: X coordinate of the top-left corner.
             y: Y coordinate of the top-left corner.
             width: Width of the capture region.
             height: Height of the capture region.
-            
+
         Returns:
             PIL Image of the captured region.
         """
-        monitor = {
-            "top": y,
-            "left": x,
-            "width": width,
-            "height": height
-        }
-        
-        # Create MSS instance in the current thread
-        with mss.mss() as sct:
-            screenshot = sct.grab(monitor)
-            
-            # Convert to PIL Image
-            img = Image.frombytes(
-                "RGB",
-                (screenshot.width, screenshot.height),
-                screenshot.rgb
-            )
-        
-        return img
+        return self.to_image(self.grab(x, y, width, height))
 
     def capture_around_mouse(self, width: int, height: int) -> tuple[Image.Image, tuple[int, int]]:
         """
         Capture a region centered around the current mouse position.
-        
+
         Args:
             width: Width of the capture region.
             height: Height of the capture region.
-            
+
         Returns:
             Tuple of (PIL Image, (x, y) top-left position of capture).
         """
         mouse_x, mouse_y = self.get_mouse_position()
-        
+
         # Calculate top-left corner (centered around mouse)
         x = max(0, mouse_x - width // 2)
         y = max(0, mouse_y - height // 2)
-        
+
         img = self.capture_region(x, y, width, height)
-        
+
         return img, (x, y)
 
     def close(self):
-        """Close the screen capture resources."""
-        pass  # Nothing to close since we create MSS per-capture
+        """Close the MSS handle (on its own thread) and stop the capture thread."""
+        def release():
+            if self._sct_handle is not None:
+                self._sct_handle.close()
+                self._sct_handle = None
+        try:
+            self._on_capture_thread(release)
+        except RuntimeError:
+            pass   # Already shut down
+        self._executor.shutdown(wait=False)
 
     def __enter__(self):
         return self
@@ -0,0 +1,164 @@
+"""
+Frame Recorder for Lingo-Live
+Keeps the last few seconds of the screen in memory so text that has
+already disappeared (subtitles, toasts) can still be selected and translated.
+Frames are stored as compressed grayscale deltas under a hard byte budget.
+"""
+
+import threading
+import time
+import zlib
+from collections import deque
+
+import numpy as np
+
+from services.capture_service import ScreenCaptureService
+
+
+class FrameRecorder:
+    """
+    Background ring buffer of recent screen frames.
+
+    Frames are grouped: each group starts with a zlib-compressed keyframe and
+    the following frames are stored as XOR deltas against it (mostly zeros, so
+    they compress to almost nothing). Whole groups are evicted oldest-first
+    when the buffer is older than `seconds` or larger than `max_bytes`; only
+    the current keyframe is held uncompressed.
+    """
+
+    PIXEL_DELTA = 16   # Gray-level change that counts as a changed pixel
+
+    def __init__(self, capture: ScreenCaptureService, seconds: float = 10.0,
+                 interval: float = 1.0, max_bytes: int = 48 * 1024 * 1024,
+                 scale: int = 1, group_size: int = 10):
+        """
+        scale: keep every Nth pixel (1 = full resolution, best for OCR).
+        """
+        self.capture = capture
+        self.seconds = seconds
+        self.interval = interval
+        self.max_bytes = max_bytes
+        self.scale = max(1, int(scale))
+        self.group_size = group_size
+        self._groups = deque()   # [[(timestamp, shape, blob, is_key)], bytes]
+        self._bytes = 0
+        self._key = None         # Raw keyframe of the group being written
+        self._last_gray = None   # Last recorded frame, for the change check
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._paused = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"[Recorder] Recording last {self.seconds:.0f}s "
+              f"(budget {self.max_bytes // (1024 * 1024)} MB)")
+
+    def stop(self):
+        self._stop.set()
+        self._thread = None
+        print("[Recorder] Stopped")
+
+    def pause(self):
+        """Freeze the buffer (frame indices stay valid while the user picks one)."""
+        self._paused.set()
+
+    def resume(self):
+        self._paused.clear()
+
+    def clear(self):
+        with self._lock:
+            self._groups.clear()
+            self._bytes = 0
+            self._key = None
+            self._last_gray = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            t0 = time.perf_counter()
+            if not self._paused.is_set():
+                try:
+                    self._record(self.capture.grab_screen())
+                except Exception as e:
+                    print(f"[Recorder] Capture error: {e}")
+            # Fixed cadence - time spent recording counts against the interval
+            self._stop.wait(max(0.05, self.interval - (time.perf_counter() - t0)))
+
+    def _record(self, bgra: np.ndarray):
+        now = time.time()
+        frame = bgra[::self.scale, ::self.scale]
+
+        # Change check on every pixel - a sparse sample misses glyph-level
+        # edits ("10" -> "16")
+        gray = np.asarray(self.capture.to_gray(frame))
+        with self._lock:
+            last = self._last_gray
+        if last is not None and last.shape == gray.shape:
+            if np.array_equal(gray, last) or \
+                    not (np.abs(gray.astype(np.int16) - last) > self.PIXEL_DELTA).any():
+                self._touch(now)
+                return
+
+        with self._lock:
+            self._last_gray = gray
+            group = self._groups[-1] if self._groups else None
+            if (group is None or self._key is None or len(group[0]) >= self.group_size
+                    or self._key.shape != gray.shape):
+                blob = zlib.compress(gray.tobytes(), 1)
+                self._key = gray
+                self._groups.append([[(now, gray.shape, blob, True)], len(blob)])
+            else:
+                blob = zlib.compress(np.bitwise_xor(gray, self._key).tobytes(), 1)
+                group[0].append((now, gray.shape, blob, False))
+                group[1] += len(blob)
+            self._bytes += len(blob)
+            self._evict(now)
+
+    def _touch(self, now: float):
+        """Screen unchanged - just move the newest frame's timestamp forward."""
+        with self._lock:
+            if self._groups:
+                frames = self._groups[-1][0]
+                ts, shape, blob, is_key = frames[-1]
+                frames[-1] = (now, shape, blob, is_key)
+            self._evict(now)
+
+    def _evict(self, now: float):
+        while self._groups and (self._bytes > self.max_bytes
+                                or self._groups[0][0][-1][0] < now - self.seconds):
+            self._bytes -= self._groups.popleft()[1]
+        if not self._groups:
+            self._key = None
+
+    def timestamps(self) -> list[float]:
+        """Capture times of the buffered frames, oldest first."""
+        with self._lock:
+            return [f[0] for group in self._groups for f in group[0]]
+
+    def frame(self, index: int) -> np.ndarray:
+        """Decode frame `index` (as in timestamps(); -1 = newest) to a grayscale array."""
+        with self._lock:
+            frames = [(group, f) for group in self._groups for f in group[0]]
+            group, (ts, shape, blob, is_key) = frames[index]
+            key_blob = group[0][0][2]
+        data = np.frombuffer(zlib.decompress(blob), dtype=np.uint8).reshape(shape)
+        if is_key:
+            return data
+        key = np.frombuffer(zlib.decompress(key_blob), dtype=np.uint8).reshape(shape)
+        return np.bitwise_xor(data, key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "frames": sum(len(group[0]) for group in self._groups),
+                "bytes": self._bytes,
+                "budget": self.max_bytes,
+            }
@@ -1,12 +1,16 @@
 """
 Gemini Service for Lingo-Live
 Wraps the google-generativeai library for text summarization.
+Requests run on the shared network runtime.
 """
 
 import os
+from concurrent.futures import Future
 import google.generativeai as genai
 from dotenv import load_dotenv
 
+from services.network_runtime import NetworkRuntime
+
 # Load environment variables
 load_dotenv()
 
@@ -21,6 +25,7 @@ class GeminiService:
             genai.configure(api_key=API_KEY)
             self.model = genai.GenerativeModel('gemini-2.5-flash')
             self._available = True
+            self.runtime = NetworkRuntime.get()
         except Exception as e:
             print(f"[Gemini] Init Error: {e}")
             self._available = False
@@ -29,6 +34,18 @@ class GeminiService:
         return self._available
 
     def summarize(self, text: str, target_language: str = None) -> str:
+        """Blocking summarize() (worker threads only)."""
+        return self.summarize_async(text, target_language).result()
+
+    def summarize_async(self, text: str, target_language: str = None) -> Future:
+        """Start a summary on the network runtime; returns its Future."""
+        if not self._available:
+            done = Future()
+            done.set_result("Gemini service is not available.")
+            return done
+        return self.runtime.submit(self._summarize(text, target_language))
+
+    async def _summarize(self, text: str, target_language: str = None) -> str:
         """
         Summarize the given text using Gemini.
         Args:
@@ -46,7 +63,7 @@ class GeminiService:
             lang_instruction = f" in {target_language}" if target_language else " in the same language as the text"
             prompt = f"Please summarize the following text concisely{lang_instruction}:\n\n{text}"
             
-            response = self.model.generate_content(prompt)
+            response = await self.model.generate_content_async(prompt)
             if response.text:
                  return response.text
             return "No summary generated."
@@ -0,0 +1,159 @@
+"""
+Hover Translator for Lingo-Live
+Translates the text line under the mouse pointer once the pointer dwells,
+without a drag selection. Results are reused for an unchanged region and
+work in flight is abandoned as soon as the pointer moves away.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from services.capture_service import ScreenCaptureService
+from services.preprocessing import ImagePreprocessor
+
+
+class HoverTranslator:
+    """Dwell detection around the pointer, with result reuse and cancellation."""
+
+    def __init__(self, capture: ScreenCaptureService, process, on_result,
+                 width: int = 400, height: int = 150, dwell: float = 0.5,
+                 poll: float = 0.03, move_tolerance: int = 6, cache_size: int = 64,
+                 ignore=None):
+        """
+        process: process(image, cancelled) -> (text, translation) or None.
+            Called on a worker thread; should check cancelled() between steps.
+        on_result: on_result(text, translation) for results that are still current.
+        ignore: optional ignore(x, y) -> bool to skip positions (e.g. our own window).
+        """
+        self.capture = capture
+        self.process = process
+        self.on_result = on_result
+        self.width = width
+        self.height = height
+        self.dwell = dwell
+        self.poll = poll
+        self.move_tolerance = move_tolerance
+        self.cache_size = cache_size
+        self.ignore = ignore
+        self._results = OrderedDict()   # pixel hash -> (text, translation)
+        self._generation = 0            # Bumped on every move; stale work is dropped
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"[Hover] Started (dwell {self.dwell}s)")
+
+    def stop(self):
+        self._stop.set()
+        self._cancel()
+        self._thread = None
+        print("[Hover] Stopped")
+
+    def clear(self):
+        """Forget reused results (e.g. after the target language changed)."""
+        with self._lock:
+            self._results.clear()
+
+    def _cancel(self):
+        with self._lock:
+            self._generation += 1
+
+    def _current(self, generation: int) -> bool:
+        return generation == self._generation and not self._stop.is_set()
+
+    def _run(self):
+        last_pos = None
+        still_since = time.perf_counter()
+        handled = False   # Already captured at this resting position
+
+        while not self._stop.is_set():
+            try:
+                pos = self.capture.get_mouse_position()
+            except Exception as e:
+                print(f"[Hover] Pointer error: {e}")
+                break
+
+            now = time.perf_counter()
+            if (last_pos is None or abs(pos[0] - last_pos[0]) > self.move_tolerance
+                    or abs(pos[1] - last_pos[1]) > self.move_tolerance):
+                if handled:
+                    self._cancel()
+                last_pos, still_since, handled = pos, now, False
+            elif not handled and now - still_since >= self.dwell:
+                handled = True
+                if not (self.ignore and self.ignore(*pos)):
+                    self._capture(pos)
+            self._stop.wait(self.poll)
+
+    def _capture(self, pos):
+        """Grab the line under the pointer and hand it to a worker."""
+        t0 = time.perf_counter()
+        x = max(0, pos[0] - self.width // 2)
+        y = max(0, pos[1] - self.height // 2)
+        try:
+            image = self.capture.to_gray(self.capture.grab(x, y, self.width, self.height))
+        except Exception as e:
+            print(f"[Hover] Capture error: {e}")
+            return
+
+        image = self._line_at(image, pos[1] - y)
+        if image is None:
+            return
+
+        key = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        with self._lock:
+            generation = self._generation
+            cached = self._results.get(key)
+            if cached:
+                self._results.move_to_end(key)
+        if cached:
+            print(f"[Hover] Reused result ({(time.perf_counter() - t0) * 1000:.0f}ms)")
+            self.on_result(*cached)
+            return
+
+        threading.Thread(target=self._work, args=(image, key, generation, t0),
+                         daemon=True).start()
+
+    @staticmethod
+    def _line_at(image, cursor_y: int):
+        """Crop to the text line under the cursor (less to OCR); None if there is no text."""
+        lines = ImagePreprocessor.text_lines(image, min_gap=3)
+        if not lines:
+            return None
+        # Line containing the cursor, else the nearest one
+        top, bottom = min(lines, key=lambda l: 0 if l[0] <= cursor_y < l[1]
+                          else min(abs(l[0] - cursor_y), abs(l[1] - cursor_y)))
+        pad = max(4, (bottom - top) // 3)
+        return image.crop((0, max(0, top - pad), image.width, min(image.height, bottom + pad)))
+
+    def _work(self, image, key, generation, t0):
+        cancelled = lambda: not self._current(generation)
+        try:
+            result = self.process(image, cancelled)
+        except Exception as e:
+            print(f"[Hover] Error: {e}")
+            return
+        if not result:
+            return
+
+        with self._lock:
+            self._results[key] = result
+            while len(self._results) > self.cache_size:
+                self._results.popitem(last=False)
+        if cancelled():
+            print("[Hover] Pointer moved - result dropped")
+            return
+        print(f"[Hover] Translated in {(time.perf_counter() - t0) * 1000:.0f}ms")
+        self.on_result(*result)
@@ -0,0 +1,69 @@
+"""
+Latency Tracker for Lingo-Live
+Recent response times per translation provider. The hedge delay (how long
+to wait for the primary before also asking the secondary) is a percentile
+of the primary's recent latency, so it tunes itself to the network.
+"""
+
+import math
+import threading
+from collections import deque
+
+
+class LatencyTracker:
+    """Sliding window of latencies per provider, with percentiles."""
+
+    MIN_SAMPLES = 5   # Below this the default hedge delay is used
+
+    def __init__(self, window: int = 50, percentile: float = 90, default_delay: float = 1.0,
+                 min_delay: float = 0.2, max_delay: float = 3.0):
+        """
+        window: latest samples kept per provider.
+        percentile: latency percentile used as the hedge delay.
+        default_delay: hedge delay until MIN_SAMPLES samples are in.
+        min_delay / max_delay: bounds of the hedge delay (seconds).
+        """
+        self.window = window
+        self.percentile_rank = percentile
+        self.default_delay = default_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self._samples = {}   # provider -> deque of seconds
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, seconds: float):
+        with self._lock:
+            self._samples.setdefault(provider, deque(maxlen=self.window)).append(seconds)
+
+    def percentile(self, provider: str, p: float) -> float:
+        """p-th percentile (nearest rank) of the provider's recent latency, None without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(provider, ()))
+        return self._nearest_rank(samples, p)
+
+    @staticmethod
+    def _nearest_rank(samples: list, p: float) -> float:
+        """Smallest sample with at least p% of the (sorted) samples at or below it."""
+        if not samples:
+            return None
+        rank = max(0, min(len(samples) - 1, math.ceil(p / 100 * len(samples)) - 1))
+        return samples[rank]
+
+    def hedge_delay(self, provider: str) -> float:
+        """Seconds to wait for `provider` before hedging."""
+        with self._lock:
+            count = len(self._samples.get(provider, ()))
+        if count < self.MIN_SAMPLES:
+            return self.default_delay
+        delay = self.percentile(provider, self.percentile_rank)
+        return min(self.max_delay, max(self.min_delay, delay))
+
+    def summary(self) -> str:
+        """'provider p50/p90/p99' for every provider, in ms."""
+        with self._lock:
+            snapshot = {provider: sorted(samples) for provider, samples in self._samples.items()}
+        parts = []
+        for provider, samples in snapshot.items():
+            p50, p90, p99 = (self._nearest_rank(samples, p) for p in (50, 90, 99))
+            parts.append(f"{provider} p50 {p50 * 1000:.0f} / p90 {p90 * 1000:.0f} / p99 {p99 * 1000:.0f}ms")
+        return ", ".join(parts)
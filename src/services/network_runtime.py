@@ -0,0 +1,119 @@
+"""
+Network Runtime for Lingo-Live
+One long-lived asyncio loop on a background thread that hosts every network
+client (Lingo.dev, Google fallback, Gemini, edge-tts). Clients are created
+once on that loop and reused, so requests share warm keep-alive connections
+instead of paying for a new loop and TLS handshake each time.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class NetworkRuntime:
+    """Shared event loop with a future-based API for the Tk side and worker threads."""
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> "NetworkRuntime":
+        """The process-wide runtime (started on first use)."""
+        with cls._instance_lock:
+            if cls._instance is None or cls._instance._closed:
+                cls._instance = cls()
+            return cls._instance
+
+    @classmethod
+    def shutdown(cls):
+        """Close the process-wide runtime if one was started."""
+        with cls._instance_lock:
+            instance, cls._instance = cls._instance, None
+        if instance:
+            instance.close()
+
+    def __init__(self, workers: int = 4):
+        self.loop = asyncio.new_event_loop()
+        # Blocking SDKs (deep-translator) run here, off the loop thread
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="net")
+        self.loop.set_default_executor(self._executor)
+        self._clients = {}   # name -> task creating the client (shared by concurrent callers)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, daemon=True, name="net-loop")
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro) -> Future:
+        """Schedule a coroutine on the loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro, timeout: float = None):
+        """Run a coroutine on the loop and wait for it (worker threads only, never the loop)."""
+        return self.submit(coro).result(timeout)
+
+    def call_blocking(self, fn, *args) -> Future:
+        """Run a blocking call on the runtime's thread pool."""
+        return self._executor.submit(fn, *args)
+
+    async def client(self, name: str, factory):
+        """
+        The shared client `name`, created on first use by awaiting factory().
+        Must be awaited on the loop. Clients with an async close() or
+        aclose() are closed with the runtime.
+        """
+        # Store the creating task before the first await, so callers that
+        # arrive while it is pending wait on it instead of building another
+        task = self._clients.get(name)
+        if task is None:
+            task = self._clients[name] = asyncio.ensure_future(factory())
+        try:
+            return await asyncio.shield(task)
+        except Exception:
+            if self._clients.get(name) is task:
+                del self._clients[name]   # Next caller retries
+            raise
+
+    @staticmethod
+    def then(future: Future, root, callback):
+        """
+        Tk side: call callback(result, error) on the Tk thread when `future`
+        is done, without blocking the UI.
+        """
+        def done(f):
+            try:
+                result, error = f.result(), None
+            except Exception as e:
+                result, error = None, e
+            root.after(0, lambda: callback(result, error))
+        future.add_done_callback(done)
+
+    def close(self):
+        """Close the shared clients and stop the loop."""
+        if self._closed:
+            return
+        self._closed = True
+
+        async def shutdown():
+            for name, task in self._clients.items():
+                if not task.done() or task.cancelled() or task.exception():
+                    task.cancel()
+                    continue
+                client = task.result()
+                try:
+                    close = getattr(client, 'aclose', None) or getattr(client, 'close', None)
+                    if close and asyncio.iscoroutinefunction(close):
+                        await close()
+                except Exception as e:
+                    print(f"[Network] Error closing {name}: {e}")
+            self._clients.clear()
+
+        try:
+            self.run(shutdown(), timeout=5)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,133 @@
+"""
+OCR Noise Gate for Lingo-Live
+Fast local quality check between OCR and translation. Drops junk tokens
+(icon and chart fragments like "|| ~ =") so garbage never costs a
+translation API call.
+"""
+
+import re
+
+# Most common English words - always kept
+COMMON_WORDS = set("""
+a about after all also an and any are as at be because been but by can come could day
+do even first for from get give go good have he her him his how i if in into is it its
+just know like look make me more most my new no not now of on one only or other our out
+over people say see she so some take than that the their them then there these they
+think this time to two up us use want way we well what when which who will with would
+year you your ok yes save open file edit view help close cancel settings error
+""".split())
+
+# Frequent letter bigrams in English and other Latin-script languages
+COMMON_BIGRAMS = set("""
+th he in er an re on at en nd ti es or te of ed is it al ar st to nt ng se ha as ou io le
+ve co me de hi ri ro ic ne ea ra ce li ch ll be ma si om ur ca el ta la ns ge ly ei di ec
+ho wh wa we ow us ut ot no na so pe ac il ad ss em am sa mo ie ue ui qu ct pr pa ol tr
+ag ai ab bl ci ct ep et ex fi fo ga gr id im ir is iv ke ki lo lu mi mu ni nc oc od og
+om op os ow pl po pu rd rm rn rs rt ru sc sh sp su tt ty ul um un ap ay ee oo ck ew ph
+mp gh ld nk ft pt wn ws ys ts ks ds rk lt rl sk sm sn ry ny my ky gy by dy hy cr br fr
+dr gl cl fl sl bu du fu hu nu tu vi va vo ze za au oi ua ia iz ks yo ya ye
+""".split())
+
+LATIN_VOWELS = set("aeiouyàáâäèéêëìíîïòóôöùúûü")
+# Syllabic consonants - Czech/Slovak/Croatian words like "prst", "skrz", "vlk"
+SYLLABIC = set("rlŕĺ")
+# Standalone symbols that carry meaning
+MEANINGFUL_SYMBOLS = set("&+/%$€£¥@#§®©™")
+# Real words that are mostly symbols - kept despite the alphanumeric ratio
+SYMBOL_WORDS = {"c++", "c#", "f#", "q&a", "r&d", "at&t", "b&w"}
+
+
+def _is_cjk(ch: str) -> bool:
+    """Han, kana and Hangul - every character carries meaning."""
+    code = ord(ch)
+    return (0x3040 <= code <= 0x30FF or 0x3400 <= code <= 0x4DBF or 0x4E00 <= code <= 0x9FFF
+            or 0xAC00 <= code <= 0xD7AF or 0xF900 <= code <= 0xFAFF)
+
+
+def _is_latin(ch: str) -> bool:
+    return ch.isalpha() and ord(ch) < 0x250
+
+
+class NoiseGate:
+    """Scores OCR tokens and removes the ones that are almost certainly noise."""
+
+    def __init__(self, min_word_conf: float = 40, min_alnum_ratio: float = 0.5,
+                 min_short_conf: float = 70):
+        """
+        min_alnum_ratio: tokens with fewer letters/digits than this share are
+        strokes ("|l|l|", "~~a~~"), confidence or not - except SYMBOL_WORDS.
+        min_short_conf: single letters and symbol-bearing tokens ("y", "à",
+        "C#", "&") are dropped only below this OCR confidence.
+        """
+        self.min_word_conf = min_word_conf
+        self.min_alnum_ratio = min_alnum_ratio
+        self.min_short_conf = min_short_conf
+
+    def _is_junk(self, token: str, conf: float = None) -> bool:
+        if conf is not None and conf < self.min_word_conf:
+            return True
+        weak = conf is not None and conf < self.min_short_conf
+
+        core = token.strip(".,;:!?\"'()[]{}«»“”‘’")
+        if not core:
+            return True
+        alnum = sum(1 for ch in core if ch.isalnum())
+        if not alnum:
+            # "&", "+", "%" are words; "||", "~", "=" are strokes
+            return weak or not all(ch in MEANINGFUL_SYMBOLS for ch in core)
+        if core.lower() in SYMBOL_WORDS:
+            return weak
+        if alnum / len(core) < self.min_alnum_ratio:
+            return True     # Mostly strokes ("l|_|l", "=~|e|~=")
+        if alnum < len(core):
+            # Symbol-bearing tokens ("C#", "x86-64", "e-mail") - kept unless weakly read
+            return weak
+        if any(_is_cjk(ch) for ch in core) or any(ch.isdigit() for ch in core):
+            return False
+        if re.search(r'(.)\1\1', core):
+            return True    # "lll", "~~~", "eee"
+
+        letters = [ch.lower() for ch in core if _is_latin(ch)]
+        if not letters:
+            # Other alphabets (Cyrillic, Devanagari, Arabic...) - class ratio is enough
+            return alnum < 2 and not core.isalpha()
+        word = ''.join(letters)
+        if word in COMMON_WORDS:
+            return False
+        if len(word) == 1:
+            # Lone letters are words in many languages ("y", "e", "à", "o") -
+            # only a weakly read one is likely a stroke fragment
+            return weak
+        if len(word) >= 4 and not any(ch in LATIN_VOWELS or ch in SYLLABIC for ch in word) \
+                and not core.isupper():
+            return True     # No vowels and not an acronym
+        if len(word) >= 4 and core.istitle() and not weak:
+            return False    # Names and brands ("Xbox") have unusual letter pairs
+        if len(word) >= 4:
+            bigrams = [word[i:i + 2] for i in range(len(word) - 1)]
+            score = sum(1 for bg in bigrams if bg in COMMON_BIGRAMS) / len(bigrams)
+            return score < 0.2
+        return False
+
+    def clean(self, text: str, confidences: dict = None) -> str:
+        """
+        Drop junk tokens and return what is left ("" if nothing meaningful).
+        confidences: optional word -> OCR confidence (0-100) map.
+        """
+        if not text:
+            return ""
+        confidences = confidences or {}
+        kept = [t for t in text.split() if not self._is_junk(t, confidences.get(t))]
+        if not kept or not self._is_meaningful(kept):
+            return ""
+        return ' '.join(kept)
+
+    @staticmethod
+    def _is_meaningful(tokens: list) -> bool:
+        """At least one real word: CJK text, or a token with two or more letters."""
+        for token in tokens:
+            if any(_is_cjk(ch) for ch in token):
+                return True
+            if sum(1 for ch in token if ch.isalpha()) >= 2:
+                return True
+        return False
@@ -0,0 +1,152 @@
+"""
+OCR Result Cache for Lingo-Live
+Remembers OCR text for recently captured regions, keyed by an exact hash
+of the binarized (cropped, preprocessed) image so re-captures skip
+Tesseract entirely, plus a per-line cache so scrolled captures only OCR the
+new lines.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+
+class OCRCache:
+    """Bounded LRU cache of OCR results keyed by a hash of the binarized image."""
+
+    def __init__(self, max_entries: int = 256, path: str = None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # key -> text
+        self._lock = threading.Lock()
+        self._unsaved = 0
+        if path:
+            self._load()
+
+    @staticmethod
+    def key(image: Image.Image, context: str = "") -> str:
+        """
+        Hash of the image binarized at its mid-gray level, read under
+        `context` (languages, preprocessing, strategy). Every pixel counts:
+        a one-glyph change ("3pm" -> "8pm") is a different key, while the same
+        text on a slightly different background still matches.
+        """
+        pixels = np.asarray(image.convert('L'))
+        lo, hi = int(pixels.min()), int(pixels.max())
+        binary = pixels > (lo + hi) // 2
+        digest = hashlib.blake2b(f"{context}|{binary.shape}".encode(), digest_size=16)
+        digest.update(np.packbits(binary).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """Return cached text for `key`, else None."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, text: str):
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._unsaved += 1
+            save = self.path and self._unsaved >= 10
+        if save:
+            self.save()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                rows = json.load(f)
+            for row in rows[-self.max_entries:]:
+                if len(row) == 2:   # Older block-hash rows are skipped
+                    self._entries[row[0]] = row[1]
+            print(f"[OCR Cache] Loaded {len(self._entries)} entries")
+        except Exception as e:
+            print(f"[OCR Cache] Error loading: {e}")
+
+    def save(self):
+        """Write the cache to disk (if an on-disk store is configured)."""
+        if not self.path:
+            return
+        with self._lock:
+            rows = [[key, text] for key, text in self._entries.items()]
+            self._unsaved = 0
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(rows, f, ensure_ascii=False)
+        except Exception as e:
+            print(f"[OCR Cache] Error saving: {e}")
+
+
+class LineCache:
+    """Bounded LRU of OCR text per text-line strip, keyed by an exact pixel hash."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # strip hash -> text
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(strip: np.ndarray, context: str = "") -> bytes:
+        """Hash of a grayscale line strip (pixels and shape) read under `context` (lang, mode)."""
+        digest = hashlib.blake2b(f"{context}|{strip.shape}".encode(), digest_size=16)
+        digest.update(np.ascontiguousarray(strip).tobytes())
+        return digest.digest()
+
+    def get(self, key: bytes):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, text: str):
+        with self._lock:
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
@@ -2,22 +2,226 @@
 OCR Service for Lingo-Live - Multi-language Support
 """
 
+import numpy as np
 import pytesseract
-from PIL import Image, ImageEnhance
+from PIL import Image, ImageEnhance, ImageOps
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import os
+import threading
+from collections import OrderedDict
+
+from services.ocr_cache import OCRCache, LineCache
+from services.preprocessing import ImagePreprocessor
+
+
+class OCRText(str):
+    """OCR text that carries the word confidences (word -> 0-100) it was read with."""
+
+    def __new__(cls, text: str, confidences: dict = None):
+        obj = super().__new__(cls, text)
+        obj.confidences = confidences or {}
+        return obj
+
+
+def _merge_confidences(lines) -> dict:
+    """word -> lowest confidence over the `word_confs` of OCR lines."""
+    merged = {}
+    for line in lines:
+        for word, conf in line.get("word_confs", {}).items():
+            merged[word] = min(conf, merged.get(word, conf))
+    return merged
+
+
+class TesseractEnginePool:
+    """
+    Long-lived Tesseract engines (via tesserocr) with models already loaded.
+    Engines are kept per language set and images are passed in memory. The
+    total across language sets is capped; idle engines of the least recently
+    used sets are ended to make room for a new set.
+    """
+
+    def __init__(self, size: int = None, tessdata: str = None, max_engines: int = None):
+        """
+        size: engines per language set (None = one per CPU core).
+        max_engines: engines across all language sets (None = 2 x size).
+        """
+        from tesserocr import PyTessBaseAPI, OEM
+        self._api_class = PyTessBaseAPI
+        self._oem = OEM.DEFAULT
+        self.size = max(1, size or os.cpu_count() or 1)
+        self.max_engines = max(1, max_engines or 2 * self.size)
+        self.tessdata = tessdata
+        self._idle = {}                # lang -> idle engines
+        self._created = {}             # lang -> number of engines alive
+        self._recent = OrderedDict()   # lang sets, least recently used first
+        self._closed = False
+        self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+
+    def _new_engine(self, lang: str):
+        kwargs = {"lang": lang, "oem": self._oem}
+        if self.tessdata:
+            kwargs["path"] = self.tessdata
+        return self._api_class(**kwargs)
+
+    def _evict_idle(self, keep: str) -> bool:
+        """End one idle engine of the least recently used other language set (lock held)."""
+        for lang in self._recent:
+            if lang != keep and self._idle.get(lang):
+                api = self._idle[lang].pop()
+                self._created[lang] -= 1
+                if not self._created[lang]:
+                    del self._idle[lang], self._created[lang], self._recent[lang]
+                try:
+                    api.End()
+                except Exception:
+                    pass
+                print(f"[OCR] Engine pool full - ended an idle '{lang}' engine")
+                return True
+        return False
+
+    def _acquire(self, lang: str):
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("engine pool is closed")
+                self._recent[lang] = None
+                self._recent.move_to_end(lang)
+                idle = self._idle.setdefault(lang, [])
+                if idle:
+                    return idle.pop()
+                if self._created.get(lang, 0) < self.size and (
+                        sum(self._created.values()) < self.max_engines or self._evict_idle(lang)):
+                    self._created[lang] = self._created.get(lang, 0) + 1
+                    break
+                # Every engine for this set (or the whole budget) is busy - wait for a release
+                self._available.wait()
+
+        try:
+            return self._new_engine(lang)
+        except Exception:
+            with self._available:
+                self._created[lang] -= 1
+                self._available.notify_all()
+            raise
+
+    def _release(self, lang: str, api):
+        with self._available:
+            closed = self._closed
+            if not closed:
+                try:
+                    api.Clear()
+                except Exception:
+                    pass
+                self._idle.setdefault(lang, []).append(api)
+                self._available.notify_all()
+        if closed:
+            # Pool closed while this engine was busy - end it instead
+            try:
+                api.End()
+            except Exception:
+                pass
+
+    @contextmanager
+    def engine(self, lang: str):
+        """Borrow an engine for `lang`, returning it to the pool afterwards."""
+        api = self._acquire(lang)
+        try:
+            yield api
+        finally:
+            self._release(lang, api)
+
+    def image_to_string(self, image: Image.Image, lang: str, psm: int = 6) -> str:
+        with self.engine(lang) as api:
+            api.SetPageSegMode(psm)
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+    def recognize(self, image: Image.Image, lang: str, psm: int = 6) -> tuple[str, float]:
+        """OCR `image` and return (text, mean word confidence 0-100)."""
+        with self.engine(lang) as api:
+            api.SetPageSegMode(psm)
+            api.SetImage(image)
+            return api.GetUTF8Text(), float(api.MeanTextConf())
+
+    def read_words(self, image: Image.Image, lang: str, psm: int = 6) -> list:
+        """OCR `image` and return (line index, text, confidence, box) per word."""
+        from tesserocr import RIL, iterate_level
+        words = []
+        with self.engine(lang) as api:
+            api.SetPageSegMode(psm)
+            api.SetImage(image)
+            api.Recognize()
+            iterator = api.GetIterator()
+            if iterator is None:
+                return words
+            line = -1
+            for word in iterate_level(iterator, RIL.WORD):
+                if word.IsAtBeginningOf(RIL.TEXTLINE):
+                    line += 1
+                text = word.GetUTF8Text(RIL.WORD)
+                if text:
+                    words.append((line, text, word.Confidence(RIL.WORD), word.BoundingBox(RIL.WORD)))
+        return words
+
+    def detect_script(self, image: Image.Image) -> tuple[str, float]:
+        """Run orientation/script detection and return (script name, confidence)."""
+        from tesserocr import PSM
+        with self.engine('osd') as api:
+            api.SetPageSegMode(PSM.OSD_ONLY)
+            api.SetImage(image)
+            osd = api.DetectOrientationScript()
+        if not osd:
+            return None, 0.0
+        return osd.get('script_name'), float(osd.get('script_conf', 0.0))
+
+    def warm_up(self, *langs: str):
+        """Load the models for `langs` in the background so the first capture is fast."""
+        def work():
+            for lang in langs:
+                try:
+                    with self.engine(lang):
+                        pass
+                    print(f"[OCR] Engine pool warm ({lang})")
+                except Exception as e:
+                    print(f"[OCR] Engine pool warm-up failed for '{lang}': {e}")
+        threading.Thread(target=work, daemon=True).start()
+
+    def close(self):
+        with self._available:
+            self._closed = True
+            for idle in self._idle.values():
+                for api in idle:
+                    try:
+                        api.End()
+                    except Exception:
+                        pass
+            self._idle.clear()
+            self._created.clear()
+            self._recent.clear()
+            self._available.notify_all()
 
 
 class OCRService:
     """Multi-language OCR using Tesseract."""
 
-    def __init__(self, tesseract_cmd: str = None):
-        from config import TESSERACT_CMD
-        
+    def __init__(self, tesseract_cmd: str = None, pool_size: int = None):
+        from config import (
+            TESSERACT_CMD, OCR_ENGINE_POOL, OCR_POOL_SIZE, OCR_POOL_MAX_ENGINES, TESSDATA_DIR,
+            OCR_DETECT_SCRIPT, OCR_SCRIPT_MIN_CONF, OCR_CANDIDATE_LANGS, OCR_SCRIPT_LANGS,
+            OCR_CACHE_SIZE, OCR_CACHE_FILE,
+            OCR_PREPROCESS_MODE, OCR_TARGET_X_HEIGHT, OCR_CROP_TO_TEXT,
+            OCR_PARALLEL_MIN_PIXELS, OCR_PARALLEL_WORKERS,
+            OCR_TWO_PASS, OCR_MIN_CONFIDENCE, TESSDATA_FAST_DIR,
+            OCR_INCREMENTAL, OCR_LINE_CACHE_SIZE
+        )
+
         if tesseract_cmd:
             pytesseract.pytesseract.tesseract_cmd = tesseract_cmd
         elif TESSERACT_CMD:
             pytesseract.pytesseract.tesseract_cmd = TESSERACT_CMD
-        
+
         if not self._check_tesseract():
             common_paths = [
                 r"C:\Program Files\Tesseract-OCR\tesseract.exe",
@@ -28,6 +232,47 @@ class OCRService:
                     pytesseract.pytesseract.tesseract_cmd = path
                     break
 
+        self._langs = None
+        self._installed = set()
+        self._pool = None
+        self._fast_pool = None
+        self._pool_failed = set()
+        self._executor = None
+        self._stream_executor = None
+        self.preprocess_mode = OCR_PREPROCESS_MODE
+        self.preprocessor = ImagePreprocessor(target_x_height=OCR_TARGET_X_HEIGHT)
+        self.crop_to_text = OCR_CROP_TO_TEXT
+        self.parallel_min_pixels = OCR_PARALLEL_MIN_PIXELS
+        self.parallel_workers = max(1, OCR_PARALLEL_WORKERS or os.cpu_count() or 1)
+        self.two_pass = OCR_TWO_PASS
+        self.min_confidence = OCR_MIN_CONFIDENCE
+        self.tessdata_fast = TESSDATA_FAST_DIR
+        self.incremental = OCR_INCREMENTAL
+        self.line_cache = LineCache(OCR_LINE_CACHE_SIZE)
+        self.cache = OCRCache(OCR_CACHE_SIZE, OCR_CACHE_FILE) if OCR_CACHE_SIZE else None
+
+        # Script detection settings
+        self.detect_script = OCR_DETECT_SCRIPT
+        self.script_min_conf = OCR_SCRIPT_MIN_CONF
+        self.candidate_langs = list(OCR_CANDIDATE_LANGS)
+        self.script_langs = dict(OCR_SCRIPT_LANGS)
+
+        if OCR_ENGINE_POOL:
+            try:
+                self._pool = TesseractEnginePool(pool_size or OCR_POOL_SIZE,
+                                                 self._find_tessdata(TESSDATA_DIR), OCR_POOL_MAX_ENGINES)
+                if self._can_detect_script():
+                    self._pool.warm_up('osd', *self._candidates())
+                else:
+                    self._pool.warm_up(self._lang_string())
+                if self.tessdata_fast:
+                    self._fast_pool = TesseractEnginePool(pool_size or OCR_POOL_SIZE, self.tessdata_fast,
+                                                          OCR_POOL_MAX_ENGINES)
+                print(f"[OCR] ✅ Engine pool enabled ({self._pool.size} per language set, "
+                      f"{self._pool.max_engines} in total)")
+            except ImportError:
+                print("[OCR] ⚠️ tesserocr not installed, using one tesseract process per capture")
+
     def _check_tesseract(self):
         try:
             pytesseract.get_tesseract_version()
@@ -35,46 +280,616 @@ class OCRService:
         except:
             return False
 
-    def preprocess_image(self, image: Image.Image) -> Image.Image:
-        """Preprocess for better OCR."""
+    def _find_tessdata(self, tessdata_dir: str = None):
+        """Locate the tessdata folder for the engine pool."""
+        if tessdata_dir:
+            return tessdata_dir
+        if os.environ.get("TESSDATA_PREFIX"):
+            return os.environ["TESSDATA_PREFIX"]
+        cmd_dir = os.path.dirname(str(pytesseract.pytesseract.tesseract_cmd))
+        candidate = os.path.join(cmd_dir, "tessdata")
+        return candidate if cmd_dir and os.path.isdir(candidate) else None
+
+    def preprocess_image(self, image: Image.Image, mode: str = None) -> Image.Image:
+        """
+        Preprocess for better OCR.
+        mode: 'basic' (grayscale + contrast) or 'adaptive' (NumPy pipeline with
+        x-height rescaling, auto-invert, deskew and local thresholding).
+        """
+        if (mode or self.preprocess_mode) == 'adaptive':
+            return self.preprocessor.process(image)
         gray = image.convert('L')
         enhancer = ImageEnhance.Contrast(gray)
         return enhancer.enhance(1.5)
 
-    def extract_text(self, image: Image.Image, preprocess: bool = True) -> str:
+    def _image_to_string(self, image: Image.Image, lang: str, psm: int = 6) -> str:
+        """Run OCR through the engine pool, or a tesseract process as fallback."""
+        if self._pool and lang not in self._pool_failed:
+            try:
+                return self._pool.image_to_string(image, lang, psm)
+            except Exception as e:
+                print(f"[OCR] Engine pool failed for '{lang}': {e}")
+                self._pool_failed.add(lang)
+
+        config = f'--oem 3 --psm {psm}'
+        return pytesseract.image_to_string(image, lang=lang, config=config)
+
+    def _recognize(self, image: Image.Image, lang: str, psm: int = 6) -> tuple[str, float]:
+        """OCR returning (text, mean word confidence)."""
+        if self._pool and lang not in self._pool_failed:
+            try:
+                return self._pool.recognize(image, lang, psm)
+            except Exception as e:
+                print(f"[OCR] Engine pool failed for '{lang}': {e}")
+                self._pool_failed.add(lang)
+
+        data = pytesseract.image_to_data(image, lang=lang, config=f'--oem 3 --psm {psm}',
+                                         output_type=pytesseract.Output.DICT)
+        words, confs = [], []
+        for word, conf in zip(data['text'], data['conf']):
+            if word.strip() and float(conf) >= 0:
+                words.append(word)
+                confs.append(float(conf))
+        return ' '.join(words), (sum(confs) / len(confs) if confs else 0.0)
+
+    def _read_lines(self, image: Image.Image, lang: str, psm: int = 6, fast: bool = False) -> list[dict]:
+        """
+        OCR returning one dict per text line: text, mean word confidence and
+        bounding box. fast=True uses the tessdata_fast models if configured.
+        """
+        return self._group_lines(self.read_words(image, lang, psm, fast))
+
+    def read_words(self, image: Image.Image, lang: str = None, psm: int = 6,
+                   fast: bool = False) -> list:
+        """
+        Word-level OCR: (line key, text, confidence, box) per word in reading
+        order, boxes in image pixels. lang defaults to all configured languages.
+        """
+        lang = lang or self._lang_string()
+        pool = self._fast_pool if fast and self._fast_pool else self._pool
+        failed_key = f"fast:{lang}" if pool is self._fast_pool and pool else lang
+        if pool and failed_key not in self._pool_failed:
+            try:
+                return pool.read_words(image, lang, psm)
+            except Exception as e:
+                print(f"[OCR] Engine pool failed for '{failed_key}': {e}")
+                self._pool_failed.add(failed_key)
+
+        config = f'--oem 3 --psm {psm}'
+        if fast and self.tessdata_fast:
+            config += f' --tessdata-dir "{self.tessdata_fast}"'
+        data = pytesseract.image_to_data(image, lang=lang, config=config,
+                                         output_type=pytesseract.Output.DICT)
+        words = []
+        for i, text in enumerate(data['text']):
+            key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            box = (data['left'][i], data['top'][i],
+                   data['left'][i] + data['width'][i], data['top'][i] + data['height'][i])
+            words.append((key, text, float(data['conf'][i]), box))
+        return words
+
+    def _group_lines(self, words) -> list[dict]:
+        """
+        Group (line key, text, confidence, box) words into lines, in reading
+        order, with each word's confidence in `word_confs`.
+        """
+        lines = {}
+        for key, text, conf, (left, top, right, bottom) in words:
+            text = text.strip()
+            if not text or conf < 0:
+                continue
+            line = lines.setdefault(key, {"words": [], "confs": [], "word_confs": {},
+                                          "box": [left, top, right, bottom]})
+            line["words"].append(text)
+            line["confs"].append(conf)
+            line["word_confs"][text] = min(conf, line["word_confs"].get(text, conf))
+            box = line["box"]
+            line["box"] = [min(box[0], left), min(box[1], top), max(box[2], right), max(box[3], bottom)]
+        return [{"text": ' '.join(l["words"]),
+                 "conf": sum(l["confs"]) / len(l["confs"]),
+                 "word_confs": l["word_confs"],
+                 "box": tuple(l["box"])} for l in lines.values()]
+
+    @staticmethod
+    def _psm_for(image: Image.Image) -> int:
+        """Page segmentation mode from the region's aspect ratio."""
+        w, h = image.size
+        aspect = w / max(h, 1)
+        if aspect >= 8:
+            return 7    # Single text line (subtitle, menu item, title bar)
+        if aspect <= 0.5:
+            return 4    # Single column of text (side panel, chat log)
+        return 6        # Uniform block of text
+
+    def _detect_script(self, image: Image.Image) -> tuple[str, float]:
+        """Tesseract OSD - returns (script name, confidence) or (None, 0) if unsure."""
+        if self._pool and 'osd' not in self._pool_failed:
+            try:
+                return self._pool.detect_script(image)
+            except Exception as e:
+                print(f"[OCR] Engine pool failed for 'osd': {e}")
+                self._pool_failed.add('osd')
+
+        try:
+            osd = pytesseract.image_to_osd(image, config='--psm 0',
+                                           output_type=pytesseract.Output.DICT)
+            return osd.get('script'), float(osd.get('script_conf', 0.0))
+        except Exception:
+            # OSD gives up on regions with too few characters
+            return None, 0.0
+
+    def _can_detect_script(self):
+        # Only with pooled engines - a separate OSD process costs more than it saves
+        if not self._pool or 'osd' in self._pool_failed:
+            return False
+        self._get_available_langs()
+        return self.detect_script and 'osd' in self._installed
+
+    def _candidates(self, extra=()):
+        """Installed languages to try when detection is unsure."""
+        langs = self._get_available_langs()
+        result = []
+        for lang in list(extra) + self.candidate_langs:
+            if lang in langs and lang not in result:
+                result.append(lang)
+        return result or langs[:1]
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Shared OCR thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.parallel_workers,
+                                                thread_name_prefix="ocr")
+        return self._executor
+
+    def _map(self, fn, items) -> list:
+        """Run `fn` over `items` on the shared OCR thread pool, keeping order."""
+        return list(self._get_executor().map(fn, items))
+
+    def _script_langs(self, image: Image.Image) -> tuple[str, float, list]:
+        """Detected script, its confidence and the installed traineddata for it."""
+        script, conf = self._detect_script(image)
+        available = self._get_available_langs()
+        return script, conf, [l for l in self.script_langs.get(script, []) if l in available]
+
+    def _select_lang(self, image: Image.Image) -> tuple[str, str]:
+        """
+        Detect the script and pick its traineddata. If unsure, run
+        single-language passes in parallel and keep the one with the best
+        mean confidence. Returns (lang, text) - text is None unless the
+        candidate passes already produced it.
+        """
+        script, conf, langs = self._script_langs(image)
+        if langs and conf >= self.script_min_conf:
+            print(f"[OCR] Script: {script} ({conf:.1f}) -> {'+'.join(langs)}")
+            return '+'.join(langs), None
+
+        candidates = self._candidates(langs)
+        if len(candidates) == 1:
+            return candidates[0], None
+
+        results = self._map(lambda l: (l, *self._recognize(image, l)), candidates)
+        lang, text, best = max(results, key=lambda r: r[2])
+        print(f"[OCR] Script unsure ({script}, {conf:.1f}) -> best pass: {lang} ({best:.0f})")
+        return lang, text
+
+    def _extract_by_script(self, image: Image.Image) -> str:
+        """Detect the script first and OCR with only its traineddata."""
+        lang, text = self._select_lang(image)
+        return text if text is not None else self._image_to_string(image, lang)
+
+    def _quick_lang(self, image: Image.Image, sample: Image.Image = None) -> str:
+        """
+        Language string from script detection. If unsure, candidate passes
+        run on the small `sample` region only; without a sample the top two
+        candidates are combined.
+        """
+        if not self._can_detect_script():
+            return self._lang_string()
+        script, conf, langs = self._script_langs(image)
+        if langs and conf >= self.script_min_conf:
+            return '+'.join(langs)
+        candidates = self._candidates(langs)
+        if sample is None or len(candidates) == 1:
+            return '+'.join(candidates[:2])
+        results = self._map(lambda l: (l, self._recognize(sample, l)[1]), candidates)
+        return max(results, key=lambda r: r[1])[0]
+
+    def _extract_two_pass(self, image: Image.Image) -> str:
+        """
+        Confidence-driven OCR. A cheap first pass (fast models, psm from the
+        region's shape, no preprocessing) reads per-word confidences; only
+        lines below `min_confidence` are re-run with the default (best)
+        models and adaptive preprocessing.
+        """
+        lang = self._quick_lang(image)
+        try:
+            lines = self._read_lines(image, lang, self._psm_for(image), fast=True)
+        except Exception as e:
+            print(f"[OCR Error] {e}")
+            lines = []
+
+        low = [line for line in lines if line["conf"] < self.min_confidence]
+        if not lines or len(low) == len(lines):
+            print("[OCR] Fast pass unusable - full pass with best models")
+            return OCRText(self._extract(self.preprocess_image(image, 'adaptive')))
+        if not low:
+            return OCRText(' '.join(line["text"] for line in lines), _merge_confidences(lines))
+
+        print(f"[OCR] Re-running {len(low)}/{len(lines)} low-confidence lines")
+        w, h = image.size
+
+        def refine(line):
+            left, top, right, bottom = line["box"]
+            crop = image.crop((max(0, left - 6), max(0, top - 6), min(w, right + 6), min(h, bottom + 6)))
+            try:
+                text = self._image_to_string(self.preprocess_image(crop, 'adaptive'), lang, psm=7)
+                if text.split():
+                    # Re-read without word confidences - the old ones no longer apply
+                    line["text"], line["word_confs"] = ' '.join(text.split()), {}
+            except Exception as e:
+                print(f"[OCR Error] {e}")
+
+        self._map(refine, low)
+        return OCRText(' '.join(line["text"] for line in lines), _merge_confidences(lines))
+
+    def _extract_incremental(self, image: Image.Image, preprocess: bool = True, mode: str = None) -> str:
+        """
+        Line-level incremental OCR for repeated and scrolling captures.
+        Each text row strip is hashed on the raw pixels; rows seen before
+        reuse their cached text and only new or changed rows are OCR'd,
+        in contiguous chunks, then stitched back in reading order.
+        Captures without separable text rows go through the regular path.
+        """
+        gray = image.convert('L')
+        pixels = np.asarray(gray)
+        ink = self.preprocessor.ink_mask(gray)
+        lines = self.preprocessor.text_lines(gray, ink=ink)
+        if not lines:
+            return OCRText(self._extract(self.preprocess_image(image, mode) if preprocess else image))
+
+        w, h = image.size
+        cuts = [0] + [(lines[i][1] + lines[i + 1][0]) // 2 for i in range(len(lines) - 1)] + [h]
+        centers = [(top + bottom) / 2 for top, bottom in lines]
+
+        # The language this capture is read with, so text read with another
+        # language (or preprocessing) is never reused
+        lang = self._quick_lang(image, sample=image.crop((0, cuts[0], w, cuts[1])))
+        context = f"{lang}|{mode or self.preprocess_mode if preprocess else 'raw'}|psm6"
+        keys = []
+        for top, bottom in lines:
+            # Trim each strip to its own ink so crop/scroll offsets don't change the hash
+            cols = np.flatnonzero(ink[top:bottom].any(axis=0))
+            keys.append(self.line_cache.key(pixels[top:bottom, cols[0]:cols[-1] + 1], context))
+        texts = [self.line_cache.get(key) for key in keys]
+        new = [i for i, text in enumerate(texts) if text is None]
+        if not new:
+            print(f"[OCR] All {len(lines)} lines cached")
+            return OCRText(' '.join(t for t in texts if t))
+
+        print(f"[OCR] Incremental: {len(new)}/{len(lines)} lines new")
+
+        # Contiguous runs of new lines, split so large runs still OCR in parallel
+        chunk_size = max(4, -(-len(new) // self.parallel_workers))
+        chunks = []
+        for i in new:
+            if chunks and chunks[-1][-1] == i - 1 and len(chunks[-1]) < chunk_size:
+                chunks[-1].append(i)
+            else:
+                chunks.append([i])
+
+        confidences = {}   # Of the lines OCR'd now (cached lines have none)
+
+        def ocr_chunk(chunk):
+            first, last = chunk[0], chunk[-1]
+            crop = image.crop((0, cuts[first], w, cuts[last + 1]))
+            prepared = self.preprocess_image(crop, mode) if preprocess else crop
+            scale = crop.height / max(prepared.height, 1)
+            found, cache = {}, True
+            try:
+                tess_lines = self._read_lines(prepared, lang)
+            except Exception as e:
+                print(f"[OCR Error] {e} - retrying lines with 'eng'")
+                try:
+                    tess_lines = self._read_lines(prepared, 'eng')
+                    cache = lang == 'eng'   # Keys are for `lang`
+                except Exception as e:
+                    print(f"[OCR Error] Lines {first + 1}-{last + 1} dropped: {e}")
+                    return None, None, False
+            for line in tess_lines:
+                # Map each Tesseract line to the nearest row strip by its vertical center
+                y = (line["box"][1] + line["box"][3]) / 2 * scale + cuts[first]
+                i = min(chunk, key=lambda j: abs(centers[j] - y))
+                found[i] = f"{found[i]} {line['text']}" if i in found else line["text"]
+            for i in chunk:
+                found.setdefault(i, "")
+            return found, tess_lines, cache
+
+        for found, tess_lines, cache in self._map(ocr_chunk, chunks):
+            if found is None:
+                continue   # Failed lines are not cached, so the next capture retries them
+            confidences.update(_merge_confidences(tess_lines))
+            for i, text in found.items():
+                texts[i] = text
+                if cache:
+                    self.line_cache.put(keys[i], text)
+        return OCRText(' '.join(t for t in texts if t), confidences)
+
+    def _split_bands(self, image: Image.Image, count: int) -> list[Image.Image]:
+        """Cut the image into up to `count` horizontal bands at whitespace gaps between lines."""
+        lines = self.preprocessor.text_lines(image)
+        if len(lines) < 2:
+            return [image]
+
+        # Cut in the middle of each gap so every line keeps its margins
+        w, h = image.size
+        cuts = [0] + [(lines[i][1] + lines[i + 1][0]) // 2 for i in range(len(lines) - 1)] + [h]
+        count = min(count, len(lines))
+        edges = [len(lines) * i // count for i in range(count + 1)]
+        return [image.crop((0, cuts[a], w, cuts[b])) for a, b in zip(edges, edges[1:])]
+
+    def _extract_bands(self, image: Image.Image) -> str:
+        """OCR a large capture as line bands in parallel, reassembled in reading order."""
+        bands = self._split_bands(image, self.parallel_workers)
+        if len(bands) == 1:
+            return None
+        print(f"[OCR] Large capture - {len(bands)} bands in parallel")
+
+        first = None
+        if self._can_detect_script():
+            lang, first = self._select_lang(bands[0])
+        else:
+            lang = self._lang_string()
+
+        todo = bands[1:] if first is not None else bands
+        texts = self._map(lambda band: self._image_to_string(band, lang), todo)
+        if first is not None:
+            texts.insert(0, first)
+        return '\n'.join(texts)
+
+    def _split_paragraphs(self, image: Image.Image, max_lines: int = 4) -> list[Image.Image]:
+        """
+        Cut the image into paragraph chunks (at gaps noticeably taller than
+        the usual line gap), each at most `max_lines` lines, in reading order.
+        """
+        lines = self.preprocessor.text_lines(image)
+        if len(lines) < 2:
+            return [image]
+
+        w, h = image.size
+        gaps = [lines[i + 1][0] - lines[i][1] for i in range(len(lines) - 1)]
+        para_gap = sorted(gaps)[len(gaps) // 2] * 1.5
+
+        chunks, start = [], 0
+        for i, gap in enumerate(gaps):
+            if gap > para_gap or i + 1 - start >= max_lines:
+                chunks.append((start, i))
+                start = i + 1
+        chunks.append((start, len(lines) - 1))
+
+        # Cut in the middle of the gaps around each chunk
+        cuts = [0] + [(lines[i][1] + lines[i + 1][0]) // 2 for i in range(len(lines) - 1)] + [h]
+        return [image.crop((0, cuts[first], w, cuts[last + 1])) for first, last in chunks]
+
+    def _prepare(self, image: Image.Image, preprocess: bool, mode: str) -> Image.Image:
+        """Crop to text and preprocess. Returns None for blank regions."""
+        if self.crop_to_text:
+            # Blank regions return immediately; otherwise OCR only the inked area
+            bbox = self.preprocessor.text_bbox(image)
+            if bbox is None:
+                print("[OCR] Blank region - skipped")
+                return None
+            if bbox != (0, 0, *image.size):
+                image = image.crop(bbox)
+
+        if preprocess:
+            image = self.preprocess_image(image, mode)
+        return image
+
+    def profile_candidates(self, image: Image.Image) -> list[dict]:
+        """
+        OCR profiles worth trying on a fixed region: page segmentation modes
+        for its shape, 2x upscaling for small text, the other polarity and
+        all languages as alternatives to the detected one.
+        """
+        gray = image.convert('L')
+        invert = float(np.median(np.asarray(gray))) < 128   # Light text on dark
+        lang = self._select_lang(gray)[0] if self._can_detect_script() else self._lang_string()
+        psms = sorted({6, self._psm_for(gray)} | ({7} if gray.height < 60 else {4}))
+        scales = [1.0, 2.0] if gray.height < 200 else [1.0]
+
+        candidates = [{"psm": psm, "lang": lang, "scale": scale, "invert": invert}
+                      for psm in psms for scale in scales]
+        candidates.append({"psm": 6, "lang": lang, "scale": 1.0, "invert": not invert})
+        if lang != self._lang_string():
+            candidates.append({"psm": 6, "lang": self._lang_string(), "scale": 1.0, "invert": invert})
+        return candidates
+
+    def extract_with_profile(self, image: Image.Image, profile: dict) -> tuple[str, float]:
+        """OCR with a fixed profile (psm, lang, scale, invert). Returns (text, confidence)."""
+        gray = image.convert('L')
+        if profile.get("invert"):
+            gray = ImageOps.invert(gray)
+        scale = profile.get("scale", 1.0)
+        if scale != 1.0:
+            gray = gray.resize((round(gray.width * scale), round(gray.height * scale)), Image.BICUBIC)
+        text, conf = self._recognize(self.preprocess_image(gray, 'basic'),
+                                     profile["lang"], profile["psm"])
+        return text.strip(), conf
+
+    def iter_text(self, image: Image.Image, preprocess: bool = True, mode: str = None):
+        """
+        Streaming OCR: yields the text of each paragraph (or group of lines)
+        in reading order as soon as it is recognized. All chunks are OCR'd
+        concurrently, so the first one arrives after roughly one chunk's cost.
+        Chunks go through two-pass or incremental OCR like extract_text.
+        Each chunk is an OCRText with the word confidences it was read with.
+        """
+        two_pass, incremental = self._strategy(preprocess, mode)
+        image = self._prepare(image, preprocess and not (two_pass or incremental), mode)
+        if image is None:
+            return
+
+        cache_key = self._cache_key(image, preprocess, mode, two_pass, incremental)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("[OCR] Cache hit")
+                yield OCRText(cached)
+                return
+
+        chunks = self._split_paragraphs(image)
+        if two_pass or incremental:
+            # These fan out on the OCR pool themselves, so the chunks run on
+            # their own threads (no pool waiting on itself)
+            if self._stream_executor is None:
+                self._stream_executor = ThreadPoolExecutor(max_workers=self.parallel_workers,
+                                                           thread_name_prefix="ocr-stream")
+            def read(chunk):
+                try:
+                    if two_pass:
+                        return self._extract_two_pass(chunk)
+                    return self._extract_incremental(chunk, preprocess, mode)
+                except Exception as e:
+                    print(f"[OCR Error] {e} - retrying chunk with 'eng'")
+                    prepared = self.preprocess_image(chunk, mode) if preprocess else chunk
+                    return self._chunk_text(prepared, 'eng')
+            futures = [self._stream_executor.submit(read, c) for c in chunks]
+            first = None
+        else:
+            first, futures = self._stream_plain(chunks)
+
+        texts = []
+        results = ([first] if first is not None else []) + futures
+        for result in results:
+            text = result if isinstance(result, str) else result.result()
+            text = OCRText(' '.join(text.strip().split()), getattr(text, 'confidences', None))
+            if text:
+                texts.append(text)
+                yield text
+
+        if cache_key and texts:
+            self.cache.put(cache_key, ' '.join(texts))
+
+    def _stream_plain(self, chunks: list) -> tuple:
+        """Single-pass streaming: (first chunk's text or None, futures for the rest)."""
+        first = None
+        try:
+            if self._can_detect_script():
+                lang, first = self._select_lang(chunks[0])
+            else:
+                lang = self._lang_string()
+        except Exception as e:
+            print(f"[OCR Error] {e}")
+            lang = 'eng'
+
+        todo = chunks[1:] if first is not None else chunks
+        return first, [self._get_executor().submit(self._chunk_text, c, lang) for c in todo]
+
+    def _strategy(self, preprocess: bool, mode: str) -> tuple:
+        """
+        (two_pass, incremental) for a capture. Both preprocess per region
+        themselves, so the whole image is not preprocessed first.
+        """
+        two_pass = self.two_pass and preprocess and mode is None
+        return two_pass, self.incremental and not two_pass
+
+    def _cache_key(self, image: Image.Image, preprocess: bool, mode: str,
+                   two_pass: bool, incremental: bool) -> str:
+        """Whole-image cache key, including everything that changes what OCR reads."""
+        if not self.cache:
+            return None
+        strategy = "two-pass" if two_pass else "incremental" if incremental else "plain"
+        langs = f"auto:{'+'.join(self._candidates())}" if self._can_detect_script() else self._lang_string()
+        preprocessing = (mode or self.preprocess_mode) if preprocess else "raw"
+        return self.cache.key(image, f"{langs}|{preprocessing}|{strategy}|crop={self.crop_to_text}")
+
+    def _chunk_text(self, chunk: Image.Image, lang: str) -> str:
+        """OCR one streamed chunk, retrying in English if `lang` fails."""
+        try:
+            return self._image_to_string(chunk, lang)
+        except Exception as e:
+            print(f"[OCR Error] {e} - retrying chunk with 'eng'")
+        try:
+            return self._image_to_string(chunk, 'eng')
+        except Exception as e:
+            print(f"[OCR Error] Chunk dropped: {e}")
+            return ""
+
+    def extract_text(self, image: Image.Image, preprocess: bool = True, mode: str = None) -> OCRText:
         """
         Extract text from image - supports multiple languages.
         Uses multiple language packs for better recognition.
+        mode overrides the preprocessing pipeline for this capture.
+        Always returns an OCRText: word confidences are in its `confidences`
+        (empty when the path used gives none, e.g. a cache hit or plain OCR).
         """
-        if preprocess:
-            image = self.preprocess_image(image)
-        
+        two_pass, incremental = self._strategy(preprocess, mode)
+        image = self._prepare(image, preprocess and not (two_pass or incremental), mode)
+        if image is None:
+            return OCRText("")
+
+        cache_key = self._cache_key(image, preprocess, mode, two_pass, incremental)
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("[OCR] Cache hit")
+                return OCRText(cached)
+
+        if two_pass:
+            text = self._extract_two_pass(image)
+        elif incremental:
+            text = self._extract_incremental(image, preprocess, mode)
+        else:
+            text = OCRText(self._extract(image))
+        if cache_key and text:
+            self.cache.put(cache_key, text)
+        return text
+
+    def _extract(self, image: Image.Image) -> str:
+        """Run Tesseract on an already preprocessed image."""
         try:
             # Use multiple languages: English + common languages
             # Format: eng+hin+jpn+chi_sim+kor+fra+deu+spa+rus+ara
             # Only use installed language packs
-            langs = self._get_available_langs()
-            lang_str = '+'.join(langs) if langs else 'eng'
-            
-            # OCR config for better accuracy
-            config = r'--oem 3 --psm 6'
-            text = pytesseract.image_to_string(image, lang=lang_str, config=config)
+            text = None
+            w, h = image.size
+            if self.parallel_workers > 1 and w * h >= self.parallel_min_pixels:
+                text = self._extract_bands(image)
+            if text is None and self._can_detect_script():
+                text = self._extract_by_script(image)
+            elif text is None:
+                text = self._image_to_string(image, self._lang_string())
             return ' '.join(text.strip().split())
         except Exception as e:
             print(f"[OCR Error] {e}")
             # Fallback to English only
             try:
-                text = pytesseract.image_to_string(image, lang='eng', config='--oem 3 --psm 6')
+                text = self._image_to_string(image, 'eng')
                 return ' '.join(text.strip().split())
             except:
                 return ""
 
+    def _lang_string(self):
+        langs = self._get_available_langs()
+        return '+'.join(langs) if langs else 'eng'
+
+    def languages(self, wanted: list = None) -> str:
+        """Tesseract language string of the installed languages among `wanted` (default: all)."""
+        if not wanted:
+            return self._lang_string()
+        available = self._get_available_langs()
+        langs = [lang for lang in wanted if lang in available]
+        return '+'.join(langs) if langs else available[0] if available else 'eng'
+
     def _get_available_langs(self):
-        """Get list of available Tesseract language packs."""
+        """Get list of available Tesseract language packs (cached after first call)."""
+        if self._langs is not None:
+            return self._langs
         try:
             available = pytesseract.get_languages()
+            self._installed = set(available)
             # Prioritize common languages
-            priority = ['eng', 'hin', 'jpn', 'chi_sim', 'chi_tra', 'kor', 
+            priority = ['eng', 'hin', 'jpn', 'chi_sim', 'chi_tra', 'kor',
                        'fra', 'deu', 'spa', 'rus', 'ara', 'por', 'ita']
             result = []
             for lang in priority:
@@ -83,9 +898,23 @@ class OCRService:
             # Add eng as fallback if not present
             if 'eng' not in result and 'eng' in available:
                 result.insert(0, 'eng')
-            return result if result else ['eng']
+            self._langs = result if result else ['eng']
+            return self._langs
         except:
             return ['eng']
 
     def is_available(self):
         return self._check_tesseract()
+
+    def close(self):
+        """Shut down pooled engines."""
+        if self._pool:
+            self._pool.close()
+        if self._fast_pool:
+            self._fast_pool.close()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+        if self._stream_executor:
+            self._stream_executor.shutdown(wait=False)
+        if self.cache:
+            self.cache.save()
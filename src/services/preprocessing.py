@@ -0,0 +1,181 @@
+"""
+Image Preprocessing for Lingo-Live OCR
+Vectorized NumPy pipeline: auto-invert, x-height normalization, deskew
+and adaptive (Sauvola) binarization.
+"""
+
+import numpy as np
+from PIL import Image
+
+
+class ImagePreprocessor:
+    """NumPy preprocessing pipeline tuned for Tesseract."""
+
+    def __init__(self, target_x_height: int = 22, max_skew: float = 5.0,
+                 sauvola_k: float = 0.2):
+        self.target_x_height = target_x_height
+        self.max_skew = max_skew
+        self.sauvola_k = sauvola_k
+
+    def process(self, image: Image.Image) -> Image.Image:
+        """Run the full pipeline and return a binarized grayscale image."""
+        gray = np.asarray(image.convert('L'), dtype=np.float32)
+        gray = self.auto_invert(gray)
+
+        # Deskew first so text lines separate cleanly in the row profile
+        ink = gray < self.otsu_threshold(gray)
+        angle = self.estimate_skew(ink)
+        if abs(angle) >= 0.3:
+            gray = np.asarray(Image.fromarray(gray.astype(np.uint8)).rotate(
+                angle, resample=Image.BICUBIC, expand=True, fillcolor=255), dtype=np.float32)
+            ink = gray < self.otsu_threshold(gray)
+
+        x_height = self.estimate_x_height(ink)
+        if x_height:
+            gray = self.rescale(gray, self.target_x_height / x_height)
+
+        window = (self.target_x_height * 2 if x_height else 31) | 1
+        return Image.fromarray(self.sauvola(gray, window))
+
+    @staticmethod
+    def ink_mask(image: Image.Image, contrast: int = 40) -> np.ndarray:
+        """Boolean mask of pixels that differ from the background (median) by more than `contrast`."""
+        gray = np.asarray(image.convert('L'))
+        background = int(np.median(gray[::4, ::4]))
+        return (gray > background + contrast) | (gray < background - contrast)
+
+    @staticmethod
+    def text_lines(image: Image.Image, contrast: int = 40, min_gap: int = 2,
+                   ink: np.ndarray = None) -> list[tuple[int, int]]:
+        """
+        Row ranges (top, bottom) of text lines, split at whitespace gaps of
+        at least `min_gap` blank rows. Lines are in reading order.
+        Pass a precomputed `ink` mask to skip recomputing it.
+        """
+        if ink is None:
+            ink = ImagePreprocessor.ink_mask(image, contrast)
+        inked = ink.any(axis=1)
+        edges = np.diff(np.concatenate(([0], inked.astype(np.int8), [0])))
+        lines = []
+        for top, bottom in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+            if lines and top - lines[-1][1] < min_gap:
+                lines[-1] = (lines[-1][0], int(bottom))
+            else:
+                lines.append((int(top), int(bottom)))
+        return lines
+
+    @staticmethod
+    def text_bbox(image: Image.Image, contrast: int = 40, min_ink: int = 12,
+                  margin: int = 8) -> tuple[int, int, int, int]:
+        """
+        Projection-profile text-presence check. Pixels that differ from the
+        background (median) by more than `contrast` count as ink; row and
+        column ink histograms give the ink bounding box.
+        Returns (left, top, right, bottom) padded by `margin`, or None if
+        the region is blank.
+        """
+        ink = ImagePreprocessor.ink_mask(image, contrast)
+        rows = ink.sum(axis=1)
+        if rows.sum() < min_ink:
+            return None
+        cols = ink.sum(axis=0)
+
+        ys, xs = np.flatnonzero(rows), np.flatnonzero(cols)
+        h, w = ink.shape
+        return (max(0, int(xs[0]) - margin), max(0, int(ys[0]) - margin),
+                min(w, int(xs[-1]) + 1 + margin), min(h, int(ys[-1]) + 1 + margin))
+
+    @staticmethod
+    def auto_invert(gray: np.ndarray) -> np.ndarray:
+        """Flip light-on-dark text (dark themes) to dark-on-light."""
+        return 255.0 - gray if np.median(gray) < 128 else gray
+
+    @staticmethod
+    def otsu_threshold(gray: np.ndarray) -> float:
+        """Global Otsu threshold from a 256-bin histogram."""
+        hist = np.bincount(gray.astype(np.uint8).ravel(), minlength=256).astype(np.float64)
+        levels = np.arange(256)
+        w0 = np.cumsum(hist)
+        w1 = w0[-1] - w0
+        m0 = np.cumsum(hist * levels)
+        mean0 = m0 / np.maximum(w0, 1)
+        mean1 = (m0[-1] - m0) / np.maximum(w1, 1)
+        between = w0 * w1 * (mean0 - mean1) ** 2
+        return float(np.argmax(between))
+
+    @staticmethod
+    def estimate_x_height(ink: np.ndarray) -> float:
+        """
+        Estimate x-height from the row ink profile: each text line's dense
+        core (rows with at least 40% of the line's peak ink) is its x-height.
+        Returns 0 if no text lines are found.
+        """
+        rows = ink.sum(axis=1)
+        has_ink = rows > 0
+        if not has_ink.any():
+            return 0.0
+
+        # Start/end indices of consecutive inked row runs (text lines)
+        edges = np.diff(np.concatenate(([0], has_ink.astype(np.int8), [0])))
+        starts, ends = np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+        heights = []
+        for s, e in zip(starts, ends):
+            band = rows[s:e]
+            if e - s < 3:
+                continue
+            heights.append(int((band >= band.max() * 0.4).sum()))
+        return float(np.median(heights)) if heights else 0.0
+
+    @staticmethod
+    def rescale(gray: np.ndarray, scale: float) -> np.ndarray:
+        """Resize by `scale` (clamped), skipping near-no-op resizes."""
+        scale = min(max(scale, 0.25), 4.0)
+        if 0.8 <= scale <= 1.25:
+            return gray
+        h, w = gray.shape
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        resample = Image.LANCZOS if scale < 1 else Image.BICUBIC
+        img = Image.fromarray(gray.astype(np.uint8)).resize(size, resample)
+        return np.asarray(img, dtype=np.float32)
+
+    def estimate_skew(self, ink: np.ndarray, step: float = 0.5) -> float:
+        """
+        Projection-profile deskew: shear ink coordinates for each candidate
+        angle and keep the one with the sharpest row histogram.
+        """
+        ys, xs = np.nonzero(ink)
+        if len(ys) < 50:
+            return 0.0
+        if len(ys) > 50000:
+            pick = np.random.default_rng(0).choice(len(ys), 50000, replace=False)
+            ys, xs = ys[pick], xs[pick]
+
+        angles = np.arange(-self.max_skew, self.max_skew + step / 2, step)
+        shifts = np.tan(np.radians(angles))[:, None] * xs[None, :]
+        rows = np.round(ys[None, :] - shifts).astype(np.int64)
+        rows -= rows.min()
+        height = rows.max() + 1
+        offsets = (np.arange(len(angles)) * height)[:, None]
+        hist = np.bincount((rows + offsets).ravel(), minlength=len(angles) * height)
+        scores = (hist.reshape(len(angles), height).astype(np.float64) ** 2).sum(axis=1)
+        # The shear that flattens the lines is also the PIL rotation that undoes the skew
+        return float(angles[np.argmax(scores)])
+
+    def sauvola(self, gray: np.ndarray, window: int) -> np.ndarray:
+        """Sauvola local thresholding using integral images."""
+        h, w = gray.shape
+        r = window // 2
+        padded = np.pad(gray.astype(np.float64), r + 1, mode='edge')
+        s1 = padded.cumsum(0).cumsum(1)
+        s2 = (padded ** 2).cumsum(0).cumsum(1)
+
+        def box(s):
+            return (s[window:window + h, window:window + w] - s[:h, window:window + w]
+                    - s[window:window + h, :w] + s[:h, :w])
+
+        area = float(window * window)
+        mean = box(s1) / area
+        std = np.sqrt(np.maximum(box(s2) / area - mean ** 2, 0))
+        threshold = mean * (1 + self.sauvola_k * (std / 128.0 - 1))
+        return np.where(gray > threshold, 255, 0).astype(np.uint8)
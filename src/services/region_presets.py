@@ -0,0 +1,126 @@
+"""
+Region Presets for Lingo-Live
+Named screen regions (a game dialogue box, a subtitle strip) captured with
+their own hotkey, no selector. Each preset learns the OCR profile (psm,
+languages, scale, inversion) that works best there over its first few
+captures and then always uses it.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+class RegionPresets:
+    """Persistent region presets with per-region OCR profile tuning."""
+
+    def __init__(self, ocr, path: str = "regions.json", tuning_runs: int = 3):
+        """
+        ocr: OCRService used for capture and tuning.
+        tuning_runs: captures that try every candidate profile before one is fixed.
+        """
+        self.ocr = ocr
+        self.path = path
+        self.tuning_runs = tuning_runs
+        self._lock = threading.Lock()
+        self.presets = self._load()
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[Regions] Error loading: {e}")
+            return {}
+
+    def save(self):
+        with self._lock:
+            data = json.dumps(self.presets, indent=4, ensure_ascii=False)
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"[Regions] Error saving: {e}")
+
+    def add(self, name: str, region: tuple, hotkey: str = None) -> dict:
+        """Create (or replace) a preset for region (x, y, w, h) in screen pixels."""
+        with self._lock:
+            self.presets[name] = {
+                "region": list(region),
+                "hotkey": hotkey,
+                "profile": None,   # Fixed once tuning is done
+                "scores": {},      # Candidate profile -> [score sum, seconds sum, runs]
+            }
+        self.save()
+        print(f"[Regions] Saved '{name}' {tuple(region)} ({hotkey or 'no hotkey'})")
+        return self.presets[name]
+
+    def remove(self, name: str):
+        with self._lock:
+            self.presets.pop(name, None)
+        self.save()
+
+    def next_hotkey(self) -> str:
+        """First free ctrl+alt+<digit> hotkey."""
+        used = {p.get("hotkey") for p in self.presets.values()}
+        for digit in "123456789":
+            if f"ctrl+alt+{digit}" not in used:
+                return f"ctrl+alt+{digit}"
+        return None
+
+    def recognize(self, name: str, image) -> str:
+        """OCR a capture of preset `name` with its learned profile (tuning it if not learned yet)."""
+        preset = self.presets[name]
+        if preset["profile"]:
+            text, conf = self.ocr.extract_with_profile(image, preset["profile"])
+            # Nothing with the learned profile - the region may show something unusual
+            return text or self.ocr.extract_text(image)
+        return self._tune(name, preset, image)
+
+    @staticmethod
+    def _score(text: str, conf: float) -> float:
+        """
+        Confidence weighted by the characters recognized, so a profile that
+        reads one clean word doesn't beat one that reads the whole line.
+        """
+        return conf * sum(ch.isalnum() for ch in text) if text else 0.0
+
+    def _tune(self, name: str, preset: dict, image) -> str:
+        """Run every candidate profile, keep score, and return the best text of this run."""
+        # One after the other, so each time is the profile's own cost and
+        # not its share of the CPU while the others run
+        results = []
+        for profile in self.ocr.profile_candidates(image):
+            t0 = time.perf_counter()
+            text, conf = self.ocr.extract_with_profile(image, profile)
+            results.append((profile, text, self._score(text, conf), time.perf_counter() - t0))
+        with self._lock:
+            scores = preset["scores"]
+            for profile, text, score, seconds in results:
+                entry = scores.setdefault(json.dumps(profile, sort_keys=True), [0.0, 0.0, 0])
+                entry[0] += score
+                entry[1] += seconds
+                entry[2] += 1
+
+            runs = max(entry[2] for entry in scores.values())
+            if runs >= self.tuning_runs:
+                preset["profile"] = self._best(scores)
+                print(f"[Regions] '{name}' tuned after {runs} captures: {preset['profile']}")
+        self.save()
+
+        profile, text, score, seconds = max(results, key=lambda r: r[2])
+        print(f"[Regions] '{name}' tuning run: best {profile} ({score:.0f})")
+        return text
+
+    @staticmethod
+    def _best(scores: dict) -> dict:
+        """
+        Highest mean score; among profiles within 3% of it, the fastest one.
+        """
+        means = {key: (score / runs, seconds / runs) for key, (score, seconds, runs) in scores.items()}
+        top = max(score for score, seconds in means.values())
+        close = [key for key, (score, seconds) in means.items() if score >= top * 0.97]
+        return json.loads(min(close, key=lambda key: means[key][1]))
@@ -0,0 +1,106 @@
+"""
+Region Watcher for Lingo-Live
+Pins a screen region (subtitles, game text boxes) and samples it at an
+adaptive frame rate. OCR and translation only run once the region's content
+has changed and settled; while it stays static the sampling backs off.
+"""
+
+import threading
+
+import numpy as np
+
+from services.capture_service import ScreenCaptureService
+
+
+class RegionWatcher:
+    """Watches a screen region and reports settled content changes."""
+
+    PIXEL_DELTA = 24    # Gray-level change that counts a pixel as changed
+    ROW_PIXELS = 3      # Changed pixels in one row that count as changed text (a caret has fewer)
+
+    def __init__(self, capture: ScreenCaptureService, region: tuple, on_change,
+                 min_interval: float = 0.1, max_interval: float = 1.0,
+                 threshold: float = 0.01, debounce: int = 2):
+        """
+        region: (x, y, width, height) in screen pixels.
+        on_change: called from the watcher thread with a grayscale image of
+            the region each time new content has settled.
+        threshold: fraction of pixels that must change; a change confined to
+            a few rows (one digit of a ticker) counts once any row has
+            ROW_PIXELS changed pixels.
+        debounce: consecutive stable samples required before reporting, so
+            fade-in/out transitions are not OCR'd half-drawn.
+        """
+        self.capture = capture
+        self.region = region
+        self.on_change = on_change
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.threshold = threshold
+        self.debounce = debounce
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"[Watch] Watching region {self.region}")
+
+    def stop(self, wait: bool = False):
+        """Stop watching; wait=True also waits for a running on_change to finish."""
+        self._stop.set()
+        thread, self._thread = self._thread, None
+        if wait and thread and thread is not threading.current_thread():
+            thread.join()
+        print("[Watch] Stopped")
+
+    def _changed(self, a: np.ndarray, b: np.ndarray) -> bool:
+        """True if more than `threshold` of the pixels differ, or any row has a glyph-sized change."""
+        if a is None or b is None or a.shape != b.shape:
+            return True
+        if np.array_equal(a, b):
+            return False
+        diff = np.abs(a.astype(np.int16) - b.astype(np.int16)) > self.PIXEL_DELTA
+        return diff.mean() > self.threshold or bool((diff.sum(axis=1) >= self.ROW_PIXELS).any())
+
+    def _run(self):
+        x, y, w, h = self.region
+        interval = self.min_interval
+        reported = None    # Sample of the content last handed to on_change
+        previous = None    # Sample from the previous tick
+        stable = 0
+
+        try:
+            while not self._stop.is_set():
+                frame = self.capture.grab(x, y, w, h)
+                # Green channel approximates luma well enough for differencing;
+                # every pixel, so a one-glyph change is never skipped
+                sample = frame[:, :, 1].copy()
+
+                if self._changed(sample, previous):
+                    # Still moving (new line fading in, scrolling) - sample fast
+                    stable = 0
+                    interval = self.min_interval
+                else:
+                    stable += 1
+                    if stable >= self.debounce and self._changed(sample, reported):
+                        reported = sample
+                        try:
+                            self.on_change(self.capture.to_gray(frame))
+                        except Exception as e:
+                            print(f"[Watch] Handler error: {e}")
+                        interval = self.min_interval
+                    elif stable > self.debounce:
+                        # Nothing new - back off towards max_interval
+                        interval = min(interval * 1.5, self.max_interval)
+                previous = sample
+                self._stop.wait(interval)
+        except Exception as e:
+            print(f"[Watch] Capture error: {e}")
@@ -0,0 +1,178 @@
+"""
+Screen Index for Lingo-Live
+Predictive OCR: while the app is idle, the whole screen is OCR'd in the
+background and its word boxes are kept in a grid index. A selection on an
+unchanged screen is answered from the index without running OCR.
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from services.capture_service import ScreenCaptureService
+
+
+class WordGrid:
+    """Uniform-grid spatial index of OCR word boxes."""
+
+    def __init__(self, words: list, cell: int = 64):
+        """words: (line key, text, confidence, (left, top, right, bottom)) in reading order."""
+        self.cell = cell
+        self.words = words
+        self._cells = {}   # (cx, cy) -> word indices
+        for i, (key, text, conf, (left, top, right, bottom)) in enumerate(words):
+            for cx in range(left // cell, (right - 1) // cell + 1):
+                for cy in range(top // cell, (bottom - 1) // cell + 1):
+                    self._cells.setdefault((cx, cy), []).append(i)
+
+    def query(self, rect: tuple) -> list:
+        """Words whose box center lies inside rect (left, top, right, bottom), in reading order."""
+        left, top, right, bottom = rect
+        found = set()
+        for cx in range(left // self.cell, (right - 1) // self.cell + 1):
+            for cy in range(top // self.cell, (bottom - 1) // self.cell + 1):
+                found.update(self._cells.get((cx, cy), ()))
+        hits = []
+        for i in sorted(found):
+            l, t, r, b = self.words[i][3]
+            if left <= (l + r) / 2 < right and top <= (t + b) / 2 < bottom:
+                hits.append(self.words[i])
+        return hits
+
+
+class ScreenIndexer:
+    """Background full-screen OCR into a WordGrid, refreshed when the screen changes."""
+
+    PIXEL_DELTA = 16         # Gray-level change that counts as a changed pixel
+    RESCAN_FRACTION = 0.005  # Changed share of the screen worth a rescan (not a clock tick)
+
+    def __init__(self, capture: ScreenCaptureService, ocr, interval: float = 5.0,
+                 cell: int = 64, skip=None, lang: str = None, min_gap: float = 30.0):
+        """
+        ocr: OCRService used for the scans.
+        interval: seconds between change checks.
+        skip: optional skip() -> bool; no scan while it returns True (e.g. mid-selection).
+        lang: Tesseract languages for the scans (keep it short - every extra
+        traineddata slows the full-screen pass).
+        min_gap: minimum seconds between two scans, so the background OCR
+        never takes more than a small share of the CPU.
+        """
+        self.capture = capture
+        self.ocr = ocr
+        self.interval = interval
+        self.cell = cell
+        self.skip = skip
+        self.lang = lang
+        self.min_gap = min_gap
+        self.hits = 0
+        self.misses = 0
+        self._grid = None
+        self._sample = None      # Sparse sample of the indexed frame (rescan trigger)
+        self._gray = None        # Full-resolution gray of the indexed frame (lookup check)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        print(f"[Index] Background screen OCR every {self.interval:.0f}s")
+
+    def stop(self):
+        self._stop.set()
+        self._thread = None
+        print("[Index] Stopped")
+
+    @staticmethod
+    def _sample_of(frame: np.ndarray) -> np.ndarray:
+        return frame[::4, ::4, 1].astype(np.int16)
+
+    def _same(self, a: np.ndarray, b: np.ndarray) -> bool:
+        return (a is not None and b is not None and a.shape == b.shape
+                and not (np.abs(a - b) > self.PIXEL_DELTA).any())
+
+    def _changed(self, a: np.ndarray, b: np.ndarray) -> float:
+        """Share of sampled pixels that differ (1.0 if not comparable)."""
+        if a is None or b is None or a.shape != b.shape:
+            return 1.0
+        return float((np.abs(a - b) > self.PIXEL_DELTA).mean())
+
+    def _run(self):
+        pending = None   # Sample of a changed screen waiting to settle
+        last_scan = 0.0
+        while not self._stop.wait(self.interval):
+            if self.skip and self.skip():
+                continue
+            if time.perf_counter() - last_scan < self.min_gap:
+                continue
+            try:
+                frame = self.capture.grab_screen()
+                sample = self._sample_of(frame)
+                with self._lock:
+                    indexed = self._sample
+                if self._changed(sample, indexed) < self.RESCAN_FRACTION:
+                    continue
+                # Only scan a screen that held still for one interval
+                if self._changed(sample, pending) >= self.RESCAN_FRACTION:
+                    pending = sample
+                    continue
+                self._scan(frame, sample)
+                last_scan = time.perf_counter()
+                pending = None
+            except Exception as e:
+                print(f"[Index] Scan error: {e}")
+
+    def _scan(self, frame: np.ndarray, sample: np.ndarray):
+        t0 = time.perf_counter()
+        gray = self.capture.to_gray(frame)
+        image = self.ocr.preprocess_image(gray, mode='basic')
+        words = []
+        for key, text, conf, box in self.ocr.read_words(image, lang=self.lang, psm=3):
+            text = text.strip()
+            if text and conf >= 0:
+                words.append((key, text, conf, tuple(int(v) for v in box)))
+        grid = WordGrid(words, self.cell)
+        with self._lock:
+            self._grid, self._sample, self._gray = grid, sample, np.asarray(gray)
+        print(f"[Index] Indexed {len(words)} words in {time.perf_counter() - t0:.1f}s")
+
+    def lookup(self, frame: np.ndarray, rect: tuple):
+        """
+        Text inside rect (frame pixels) if that part of `frame` is unchanged
+        since the last scan, else None. Returns (text, word confidences).
+        """
+        with self._lock:
+            grid, indexed = self._grid, self._gray
+        if grid is None or frame.ndim != 3 or frame.shape[:2] != indexed.shape:
+            self.misses += 1
+            return None
+        # Only the selected area has to match - the rest of the screen (our
+        # own window, a clock) may well have changed since the scan. Every
+        # pixel of it counts: one changed glyph ("3.50" -> "3,50") is a miss.
+        left, top, right, bottom = rect
+        current = np.asarray(self.capture.to_gray(frame[top:bottom, left:right]))
+        if not self._same(current.astype(np.int16), indexed[top:bottom, left:right].astype(np.int16)):
+            self.misses += 1
+            return None
+        words = grid.query(rect)
+        if not words:
+            self.misses += 1
+            return None
+        self.hits += 1
+
+        lines, confidences, last_key = [], {}, None
+        for key, text, conf, box in words:
+            if key != last_key:
+                lines.append([])
+                last_key = key
+            lines[-1].append(text)
+            confidences[text] = min(conf, confidences.get(text, conf))
+        return '\n'.join(' '.join(line) for line in lines), confidences
@@ -0,0 +1,123 @@
+"""
+Scroll Stitcher for Lingo-Live
+Stitches successive captures of a scrolling region into one tall image.
+The vertical overlap between frames is found by matching per-row hashes,
+so only the newly revealed strip is handed to OCR and translation.
+"""
+
+import numpy as np
+from PIL import Image
+
+from services.preprocessing import ImagePreprocessor
+
+
+class ScrollStitcher:
+    """Accumulates a scrolled document and hands out the lines not yet processed."""
+
+    def __init__(self, min_overlap: int = 24, min_match: float = 0.75,
+                 max_height: int = 40000):
+        """
+        min_overlap: fewest overlapping rows that count as a match.
+        min_match: fraction of overlapping text rows whose hashes must agree.
+        max_height: cap on the stitched image (oldest rows are dropped).
+        """
+        self.min_overlap = min_overlap
+        self.min_match = min_match
+        self.max_height = max_height
+        self._strips = []        # Stitched document, top to bottom
+        self._height = 0
+        self._pending = None     # Rows not yet handed out by take_lines()
+        self._last = None        # Previous frame
+        self._last_hashes = None
+        self._weights = None
+
+    def _row_hashes(self, gray: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Per-row hashes (quantized so anti-aliasing noise doesn't matter) and a
+        mask of rows that carry content - blank rows match anything.
+        """
+        if self._weights is None or len(self._weights) != gray.shape[1]:
+            rng = np.random.default_rng(0x5C0)
+            self._weights = rng.integers(1, 2 ** 63, gray.shape[1], dtype=np.uint64)
+        quantized = (gray >> 5).astype(np.uint64)
+        hashes = quantized @ self._weights   # Wraps mod 2^64 - fine for a hash
+        content = gray.max(axis=1).astype(np.int16) - gray.min(axis=1) > 32
+        return hashes, content
+
+    def _find_shift(self, hashes: np.ndarray, content: np.ndarray):
+        """
+        Rows the new frame scrolled up by relative to the previous one, or
+        None if there is no convincing overlap (scrolled too far / new page).
+        """
+        prev = self._last_hashes
+        h = len(hashes)
+        if len(prev) != h:
+            return None
+        best, best_score = None, 0.0
+        for shift in range(0, h - self.min_overlap + 1):
+            overlap = content[:h - shift]
+            rows = int(overlap.sum())
+            if rows < 3:
+                continue
+            score = (prev[shift:] == hashes[:h - shift])[overlap].sum() / rows
+            if score > best_score:
+                best, best_score = shift, score
+                if score == 1.0:
+                    break
+        return best if best_score >= self.min_match else None
+
+    def add(self, gray: np.ndarray) -> int:
+        """Add a frame; returns the number of new rows appended (0 = nothing new)."""
+        gray = np.ascontiguousarray(gray)
+        hashes, content = self._row_hashes(gray)
+
+        if self._last is None:
+            new = gray
+        else:
+            shift = self._find_shift(hashes, content)
+            if shift == 0:
+                return 0
+            if shift is None:
+                if (self._last_hashes == hashes).all():
+                    return 0
+                print("[Scroll] No overlap with previous frame - appending whole frame")
+                new = gray
+            else:
+                new = gray[len(gray) - shift:]
+
+        self._last, self._last_hashes = gray, hashes
+        self._strips.append(new)
+        self._height += len(new)
+        self._pending = new if self._pending is None else np.vstack((self._pending, new))
+        while self._height > self.max_height and len(self._strips) > 1:
+            self._height -= len(self._strips.pop(0))
+        return len(new)
+
+    def take_lines(self, final: bool = False) -> Image.Image:
+        """
+        Complete text lines added since the last call, as one image (None if
+        there are none). A line touching the bottom edge may still be cut off
+        by the viewport, so it is held back until more is revealed or `final`.
+        """
+        if self._pending is None or not len(self._pending):
+            return None
+        pending = Image.fromarray(self._pending)
+        lines = ImagePreprocessor.text_lines(pending, min_gap=3)
+        if not final and lines and lines[-1][1] >= len(self._pending) - 1:
+            lines = lines[:-1]
+        if not lines:
+            return None
+
+        if final:
+            cut = len(self._pending)
+        else:
+            cut = min(len(self._pending), lines[-1][1] + 2)
+        piece = Image.fromarray(self._pending[:cut])
+        self._pending = self._pending[cut:]
+        return piece
+
+    def image(self) -> Image.Image:
+        """The whole stitched document."""
+        if not self._strips:
+            return None
+        return Image.fromarray(np.vstack(self._strips))
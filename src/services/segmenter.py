@@ -0,0 +1,67 @@
+"""
+Text Segmenter for Lingo-Live
+Splits OCR output into sentence-sized segments that are translated (and
+cached) on their own, so a re-capture where two lines changed only sends
+those two segments. The separators are kept so the translated segments can
+be put back together with the original layout.
+"""
+
+import re
+
+# Sentence end followed by whitespace (CJK full stops need none), a colon or
+# semicolon at a line end, a blank line, or a line break before a list item
+SEGMENT_BREAK = re.compile(
+    r'((?<=[.!?…])\s+|(?<=[。！？])\s*|(?<=[;:；：])\s*\n\s*'
+    r'|\s*\n\s*\n\s*|\s*\n(?=\s*(?:[-•*·▪–]|\d+[.)])\s))'
+)
+
+# Words ending in a full stop that rarely end a sentence
+ABBREVIATIONS = {
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "jr.", "sr.", "vs.", "no.",
+    "fig.", "approx.", "e.g.", "i.e.", "a.m.", "p.m.", "cf.", "inc.", "ltd.",
+}
+
+
+def _is_sentence_break(before: str, after: str) -> bool:
+    """
+    Whether a [.!?…] + space break between before and after really ends a
+    sentence: the next one must start with a capital (or an uncased script)
+    and the stop must not belong to an abbreviation or initial ("Dr.",
+    "p.m.", "J."). A number after the stop ("Version 2. 0") never starts one.
+    """
+    word = before.rsplit(None, 1)[-1].lstrip('("\'[').lower() if before.strip() else ""
+    if word in ABBREVIATIONS or re.fullmatch(r'\w\.', word):
+        return False
+    start = after.lstrip('("\'[“‘«¿¡')[:1]
+    return start.isalpha() and not start.islower()
+
+
+def split_segments(text: str) -> tuple:
+    """
+    (segments, separators) for text, with
+    text == segments[0] + separators[0] + segments[1] + ... + segments[-1]
+    apart from leading/trailing whitespace.
+    """
+    parts = SEGMENT_BREAK.split(text.strip())
+    segments, separators = [parts[0]], []
+    for sep, segment in zip(parts[1::2], parts[2::2]):
+        if not segment.strip():
+            continue
+        # A space after a stop that doesn't end a sentence: keep it inside
+        if '\n' not in sep and segments[-1][-1:] in '.!?…' \
+                and not _is_sentence_break(segments[-1], segment):
+            segments[-1] += sep + segment
+            continue
+        separators.append(sep)
+        segments.append(segment)
+    return segments, separators
+
+
+def join_segments(segments: list, separators: list) -> str:
+    """Inverse of split_segments for (translated) segments."""
+    out = [segments[0]]
+    for sep, segment in zip(separators, segments[1:]):
+        # Keep line structure; any run of spaces becomes one space
+        out.append(sep if '\n' in sep else ' ' if sep else '')
+        out.append(segment)
+    return ''.join(out)
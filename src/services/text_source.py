@@ -0,0 +1,180 @@
+"""
+Text Source for Lingo-Live
+Text-first acquisition: when the text under the user's selection is real
+text (browser, editor, PDF viewer), read it from the X11 primary selection
+or by copying it to the clipboard instead of running OCR on a screenshot.
+"""
+
+import subprocess
+import sys
+import time
+
+
+# Foreground window classes of Windows consoles and terminals
+CONSOLE_WINDOW_CLASSES = {
+    "ConsoleWindowClass", "CASCADIA_HOSTING_WINDOW_CLASS", "mintty",
+    "VirtualConsoleClass", "PuTTY",
+}
+
+
+class TextSource:
+    """Reads freshly selected text from the OS, with a short timeout."""
+
+    def __init__(self, timeout: float = 0.25, copy: bool = True):
+        """
+        timeout: max seconds to wait for the copied text to appear.
+        copy: send a copy shortcut to the focused app (replaces the clipboard).
+        """
+        self.timeout = timeout
+        self.copy = copy
+        self._last_primary = self._read_primary()   # Only newer selections count
+
+    def _run(self, *cmds) -> str:
+        """Output of the first clipboard tool that works, else None."""
+        for cmd in cmds:
+            try:
+                out = subprocess.run(cmd, capture_output=True, timeout=self.timeout)
+            except (OSError, subprocess.TimeoutExpired):
+                continue
+            if out.returncode == 0:
+                return out.stdout.decode('utf-8', errors='replace')
+        return None
+
+    def _read_primary(self) -> str:
+        """X11/Wayland primary selection (the highlighted text) - Linux only."""
+        if not sys.platform.startswith('linux'):
+            return None
+        return self._run(['xclip', '-o', '-selection', 'primary'],
+                         ['xsel', '-o', '-p'],
+                         ['wl-paste', '--primary', '--no-newline'])
+
+    def _read_clipboard(self) -> str:
+        if sys.platform == 'win32':
+            return self._win_clipboard()
+        if sys.platform == 'darwin':
+            return self._run(['pbpaste'])
+        return self._run(['xclip', '-o', '-selection', 'clipboard'],
+                         ['xsel', '-o', '-b'],
+                         ['wl-paste', '--no-newline'])
+
+    @staticmethod
+    def _win_api():
+        import ctypes
+        user32, kernel32 = ctypes.windll.user32, ctypes.windll.kernel32
+        user32.GetClipboardData.restype = ctypes.c_void_p
+        user32.SetClipboardData.argtypes = [ctypes.c_uint, ctypes.c_void_p]
+        user32.GetForegroundWindow.restype = ctypes.c_void_p
+        user32.GetClassNameW.argtypes = [ctypes.c_void_p, ctypes.c_wchar_p, ctypes.c_int]
+        kernel32.GlobalAlloc.restype = ctypes.c_void_p
+        kernel32.GlobalLock.argtypes = [ctypes.c_void_p]
+        kernel32.GlobalLock.restype = ctypes.c_void_p
+        kernel32.GlobalUnlock.argtypes = [ctypes.c_void_p]
+        return ctypes, user32, kernel32
+
+    @classmethod
+    def _win_clipboard(cls) -> str:
+        ctypes, user32, kernel32 = cls._win_api()
+        if not user32.OpenClipboard(None):
+            return None
+        try:
+            handle = user32.GetClipboardData(13)   # CF_UNICODETEXT
+            if not handle:
+                return None
+            ptr = kernel32.GlobalLock(handle)
+            try:
+                return ctypes.wstring_at(ptr) if ptr else None
+            finally:
+                kernel32.GlobalUnlock(handle)
+        finally:
+            user32.CloseClipboard()
+
+    @classmethod
+    def _win_set_clipboard(cls, text: str):
+        ctypes, user32, kernel32 = cls._win_api()
+        data = text.encode('utf-16-le') + b'\0\0'
+        if not user32.OpenClipboard(None):
+            return
+        try:
+            user32.EmptyClipboard()
+            handle = kernel32.GlobalAlloc(0x0002, len(data))   # GMEM_MOVEABLE
+            ptr = kernel32.GlobalLock(handle)
+            ctypes.memmove(ptr, data, len(data))
+            kernel32.GlobalUnlock(handle)
+            user32.SetClipboardData(13, handle)   # CF_UNICODETEXT, owned by the clipboard now
+        finally:
+            user32.CloseClipboard()
+
+    def _write_clipboard(self, text: str):
+        if sys.platform == 'win32':
+            self._win_set_clipboard(text)
+        elif sys.platform == 'darwin':
+            subprocess.run(['pbcopy'], input=text.encode('utf-8'), timeout=self.timeout)
+
+    def _can_copy(self) -> bool:
+        """
+        Safe to send the copy shortcut: not in a console window (where ctrl+c
+        interrupts) and not over non-text clipboard content we couldn't restore.
+        """
+        if sys.platform != 'win32':
+            return True   # macOS: command+c never interrupts
+        ctypes, user32, kernel32 = self._win_api()
+        name = ctypes.create_unicode_buffer(256)
+        user32.GetClassNameW(user32.GetForegroundWindow(), name, 256)
+        if name.value in CONSOLE_WINDOW_CLASSES:
+            return False
+        has_text = user32.IsClipboardFormatAvailable(13)
+        return has_text or user32.CountClipboardFormats() == 0
+
+    def _copy_selection(self) -> str:
+        """Send the copy shortcut and wait for new clipboard text, then restore the clipboard."""
+        import keyboard
+
+        if not self._can_copy():
+            return None
+        before = self._read_clipboard()
+        # The capture hotkey's modifiers are probably still held - ctrl+alt+c
+        # would not copy, so wait for them to be released first
+        deadline = time.perf_counter() + self.timeout
+        while (any(keyboard.is_pressed(k) for k in ('alt', 'shift', 'windows'))
+               and time.perf_counter() < deadline):
+            time.sleep(0.01)
+        keyboard.send('command+c' if sys.platform == 'darwin' else 'ctrl+c')
+
+        deadline = time.perf_counter() + self.timeout
+        text = None
+        while time.perf_counter() < deadline:
+            time.sleep(0.02)
+            text = self._read_clipboard()
+            if text and text != before:
+                break
+            text = None
+        if text and before is not None:
+            try:
+                self._write_clipboard(before)
+            except Exception as e:
+                print(f"[Text] Could not restore the clipboard: {e}")
+        return text
+
+    def acquire(self) -> str:
+        """Freshly selected text, or None if OCR is needed."""
+        t0 = time.perf_counter()
+        text, source = None, None
+
+        primary = self._read_primary()
+        if primary and primary.strip() and primary != self._last_primary:
+            text, source = primary, "primary selection"
+        self._last_primary = primary
+
+        # On Linux the primary selection already is the highlighted text, and
+        # ctrl+c would interrupt a terminal - only copy elsewhere
+        if not text and self.copy and not sys.platform.startswith('linux'):
+            try:
+                text, source = self._copy_selection(), "clipboard"
+            except Exception as e:
+                print(f"[Text] Copy failed: {e}")
+
+        if text and text.strip():
+            print(f"[Text] Got {len(text)} chars from {source} "
+                  f"in {(time.perf_counter() - t0) * 1000:.0f}ms - skipping OCR")
+            return text.strip()
+        return None
@@ -0,0 +1,187 @@
+"""
+Translation Cache for Lingo-Live
+Two tiers: a small in-memory LRU in front of a SQLite store that survives
+restarts. Entries are keyed by normalized source text, target locale and
+provider, expire after a TTL, and the store is trimmed to a row budget.
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+class TranslationCache:
+    """Memory LRU + persistent SQLite cache of translations, with hit/latency stats."""
+
+    PROVIDERS = ("lingodotdev", "google")   # Lookup preference
+    EVICT_EVERY = 100                       # Puts between expiry/size sweeps
+
+    def __init__(self, path: str = "translations.db", memory_size: int = 512,
+                 ttl_days: float = 30, max_rows: int = 20000):
+        """
+        path: SQLite file (None or "" keeps the cache in memory only).
+        memory_size: entries in the in-memory LRU.
+        ttl_days: age after which an entry is ignored and removed.
+        max_rows: stored entries kept, least recently used removed first.
+        """
+        self.memory_size = memory_size
+        self.ttl = ttl_days * 86400
+        self.max_rows = max_rows
+        self._memory = OrderedDict()   # (text, target, provider) -> (result, created)
+        self._lock = threading.Lock()
+        self._puts = 0
+        self._touched = {}   # (text, target, provider) -> last use not yet written to disk
+        self._db = None
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0,
+                       "lookup_seconds": 0.0, "lookups": 0,
+                       "network_seconds": 0.0, "network_calls": 0}
+        if path:
+            try:
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    " text TEXT, target TEXT, provider TEXT, result TEXT,"
+                    " created REAL, used REAL,"
+                    " PRIMARY KEY (text, target, provider))")
+                self._db.execute("CREATE INDEX IF NOT EXISTS translations_used ON translations (used)")
+                self._db.commit()
+            except Exception as e:
+                print(f"[Cache] SQLite unavailable, memory only: {e}")
+                self._db = None
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Collapse whitespace so re-captures of the same text share a key."""
+        return re.sub(r'\s+', ' ', text).strip()
+
+    def get(self, text: str, target: str, providers: tuple = None):
+        """Cached translation of text into target from any of providers (in order), else None."""
+        t0 = time.perf_counter()
+        norm = self.normalize(text)
+        providers = providers or self.PROVIDERS
+        now = time.time()
+        result, tier = None, "misses"
+        with self._lock:
+            for provider in providers:
+                entry = self._memory.get((norm, target, provider))
+                if entry and now - entry[1] < self.ttl:
+                    self._memory.move_to_end((norm, target, provider))
+                    self._touched[(norm, target, provider)] = now
+                    result, tier = entry[0], "memory_hits"
+                    break
+
+            if result is None and self._db is not None:
+                try:
+                    for provider in providers:
+                        row = self._db.execute(
+                            "SELECT result, created FROM translations"
+                            " WHERE text = ? AND target = ? AND provider = ? AND created > ?",
+                            (norm, target, provider, now - self.ttl)).fetchone()
+                        if row:
+                            result, tier = row[0], "disk_hits"
+                            self._touched[(norm, target, provider)] = now
+                            self._remember((norm, target, provider), (row[0], row[1]))
+                            break
+                except Exception as e:
+                    print(f"[Cache] Read error: {e}")
+
+            self._stats[tier] += 1
+            self._stats["lookups"] += 1
+            self._stats["lookup_seconds"] += time.perf_counter() - t0
+        return result
+
+    def put(self, text: str, target: str, provider: str, result: str):
+        """Store a translation."""
+        norm = self.normalize(text)
+        now = time.time()
+        with self._lock:
+            self._remember((norm, target, provider), (result, now))
+            self._touched.pop((norm, target, provider), None)
+            if self._db is None:
+                return
+            try:
+                self._flush_touched()
+                self._db.execute(
+                    "INSERT OR REPLACE INTO translations VALUES (?, ?, ?, ?, ?, ?)",
+                    (norm, target, provider, result, now, now))
+                self._puts += 1
+                if self._puts % self.EVICT_EVERY == 0:
+                    self._evict(now)
+                self._db.commit()
+            except Exception as e:
+                print(f"[Cache] Write error: {e}")
+
+    def _remember(self, key: tuple, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _flush_touched(self):
+        """
+        Write the batched last-use times (lock held, caller commits). Lookups
+        only note them, so a cache hit never waits on a disk write.
+        """
+        if not self._touched:
+            return
+        self._db.executemany(
+            "UPDATE translations SET used = ? WHERE text = ? AND target = ? AND provider = ?",
+            [(used, *key) for key, used in self._touched.items()])
+        self._touched.clear()
+
+    def _evict(self, now: float):
+        """Drop expired rows, then the least recently used ones over max_rows (lock held)."""
+        self._db.execute("DELETE FROM translations WHERE created <= ?", (now - self.ttl,))
+        self._db.execute(
+            "DELETE FROM translations WHERE rowid IN (SELECT rowid FROM translations"
+            " ORDER BY used DESC LIMIT -1 OFFSET ?)", (self.max_rows,))
+
+    def record_network(self, seconds: float):
+        """Time of a translation that had to go to the network (for stats)."""
+        with self._lock:
+            self._stats["network_seconds"] += seconds
+            self._stats["network_calls"] += 1
+
+    def stats(self) -> dict:
+        """Hit rate and mean lookup / network latency (ms)."""
+        with self._lock:
+            s = dict(self._stats)
+            size = len(self._memory)
+        hits = s["memory_hits"] + s["disk_hits"]
+        return {
+            "memory_hits": s["memory_hits"],
+            "disk_hits": s["disk_hits"],
+            "misses": s["misses"],
+            "hit_rate": hits / s["lookups"] if s["lookups"] else 0.0,
+            "lookup_ms": s["lookup_seconds"] * 1000 / s["lookups"] if s["lookups"] else 0.0,
+            "network_ms": s["network_seconds"] * 1000 / s["network_calls"] if s["network_calls"] else 0.0,
+            "memory_entries": size,
+        }
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            self._touched.clear()
+            if self._db is not None:
+                try:
+                    self._db.execute("DELETE FROM translations")
+                    self._db.commit()
+                except Exception as e:
+                    print(f"[Cache] Clear error: {e}")
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                try:
+                    self._flush_touched()
+                    self._db.commit()
+                except Exception as e:
+                    print(f"[Cache] Write error: {e}")
+                try:
+                    self._db.close()
+                except:
+                    pass
+                self._db = None
@@ -2,15 +2,35 @@
 Translation Service for Lingo-Live
 Uses Lingo.dev API as primary translation service.
 Falls back to Google Translate if Lingo.dev fails.
+Requests run on the shared network runtime with long-lived clients, and
+results are cached (memory + SQLite) so repeated text costs no API call.
+Text is translated per sentence segment: only segments not cached yet are
+sent, in one batched request, and reassembled in order.
+A Lingo.dev request slower than its usual (percentile) latency is hedged
+with the same request to Google; the first answer wins.
 """
 
 import asyncio
 import os
+import time
+from concurrent.futures import Future
 from typing import Optional
 
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import DEFAULT_TARGET_LANGUAGE, SUPPORTED_LANGUAGES, LINGODOTDEV_API_KEY
+from config import (
+    DEFAULT_TARGET_LANGUAGE, SUPPORTED_LANGUAGES, LINGODOTDEV_API_KEY,
+    TRANSLATION_CACHE, TRANSLATION_CACHE_FILE, TRANSLATION_CACHE_MEMORY,
+    TRANSLATION_CACHE_TTL_DAYS, TRANSLATION_CACHE_MAX_ROWS,
+    HEDGED_REQUESTS, HEDGE_PERCENTILE, HEDGE_DEFAULT_DELAY, HEDGE_MIN_DELAY, HEDGE_MAX_DELAY,
+    HEDGE_WINDOW
+)
+from services.network_runtime import NetworkRuntime
+from services.translation_cache import TranslationCache
+from services.segmenter import split_segments, join_segments
+from services.latency_tracker import LatencyTracker
+
+GOOGLE_MAX_CHARS = 4500   # deep-translator rejects requests over 5000 characters
 
 
 class TranslationService:
@@ -20,6 +40,13 @@ class TranslationService:
         self.target_language = target_language or DEFAULT_TARGET_LANGUAGE
         self.api_key = LINGODOTDEV_API_KEY
         self._use_lingodotdev = True
+        self.runtime = NetworkRuntime.get()
+        self._google_translators = {}   # target language -> GoogleTranslator
+        self.cache = TranslationCache(TRANSLATION_CACHE_FILE, TRANSLATION_CACHE_MEMORY,
+                                      TRANSLATION_CACHE_TTL_DAYS, TRANSLATION_CACHE_MAX_ROWS) \
+            if TRANSLATION_CACHE else None
+        self.latency = LatencyTracker(HEDGE_WINDOW, HEDGE_PERCENTILE, HEDGE_DEFAULT_DELAY,
+                                      HEDGE_MIN_DELAY, HEDGE_MAX_DELAY)
         
         # Check if lingodotdev is available
         try:
@@ -34,77 +61,218 @@ class TranslationService:
     def _init_fallback(self):
         """Initialize Google Translate as fallback."""
         try:
-            from deep_translator import GoogleTranslator
-            self._google = GoogleTranslator(source='auto', target=self.target_language)
+            self._google_for(self.target_language)
             print("[Translation] ✅ Google Translate fallback ready")
         except:
-            self._google = None
+            pass
 
     def set_target_language(self, language_code: str):
         if language_code in SUPPORTED_LANGUAGES:
             self.target_language = language_code
-            if not self._use_lingodotdev and hasattr(self, '_google') and self._google:
-                from deep_translator import GoogleTranslator
-                self._google = GoogleTranslator(source='auto', target=language_code)
 
     def translate(self, text: str, target_lang: str = None) -> str:
-        """Translate text using Lingo.dev API primarily."""
+        """Translate text using Lingo.dev API primarily (blocks; not for the Tk thread)."""
         if not text or not text.strip():
             return ""
+        return self.translate_async(text, target_lang).result()
 
+    def translate_async(self, text: str, target_lang: str = None) -> Future:
+        """
+        Start a translation on the network runtime and return its Future.
+        Tk code can use NetworkRuntime.then() instead of blocking on it.
+        A fully cached translation comes back as an already completed Future.
+        """
         target = target_lang or self.target_language
-        
-        # Try Lingo.dev first
-        if self._use_lingodotdev and self.api_key:
+        if not text or not text.strip():
+            return self._completed("")
+
+        segments, separators = split_segments(text)
+        results = [self.cache.get(segment, target) if self.cache else None for segment in segments]
+        missing = [i for i, result in enumerate(results) if result is None]
+        if not missing:
+            return self._completed(join_segments(results, separators))
+        return self.runtime.submit(self._translate_segments(segments, separators, results, missing, target))
+
+    @staticmethod
+    def _completed(result) -> Future:
+        done = Future()
+        done.set_result(result)
+        return done
+
+    async def _translate_segments(self, segments: list, separators: list, results: list,
+                                  missing: list, target: str) -> str:
+        """Translate the missing segments in one batch and reassemble the text."""
+        texts = list(dict.fromkeys(segments[i] for i in missing))   # Each distinct segment once
+
+        t0 = time.perf_counter()
+        translated, provider = await self._fetch(texts, target)
+        if provider is None:
+            return translated   # Failure message
+        if self.cache:
+            self.cache.record_network(time.perf_counter() - t0)
+            for text, result in zip(texts, translated):
+                self.cache.put(text, target, provider, result)
+
+        by_text = dict(zip(texts, translated))
+        for i in missing:
+            results[i] = by_text[segments[i]]
+        if len(segments) > 1:
+            print(f"[Translation] Sent {len(texts)} of {len(segments)} segments ({provider})")
+        return join_segments(results, separators)
+
+    async def _fetch(self, texts: list, target: str) -> tuple:
+        """
+        (translations, provider) for a batch of texts. If every service
+        fails, (failure message, None).
+
+        Lingo.dev goes first. If it has not answered within its hedge delay
+        (a percentile of its recent latency), the same request also goes to
+        Google; the first good answer wins and the other call is cancelled.
+        """
+        if not (self._use_lingodotdev and self.api_key):
             try:
-                result = self._translate_with_lingodotdev(text, target)
-                if result:
-                    return result
+                return await self._timed("google", self._translate_with_google, texts, target), "google"
             except Exception as e:
-                print(f"[Lingo.dev Error] {e}")
-        
-        # Fallback to Google Translate
-        return self._translate_with_google(text, target)
+                return f"[Translation failed: {e}]", None
+
+        # task -> (provider, its own start time)
+        tasks = {asyncio.ensure_future(
+            self._timed("lingodotdev", self._translate_with_lingodotdev, texts, target)):
+            ("lingodotdev", time.perf_counter())}
+
+        def start_google():
+            task = asyncio.ensure_future(self._timed("google", self._translate_with_google, texts, target))
+            tasks[task] = ("google", time.perf_counter())
+
+        delay = self.latency.hedge_delay("lingodotdev") if HEDGED_REQUESTS else None
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if not done:
+            print(f"[Translation] Lingo.dev slower than {delay:.2f}s - hedging with Google")
+            start_google()
+
+        error = None
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                provider, _ = tasks.pop(task)
+                try:
+                    results = task.result()
+                except Exception as e:
+                    error = e
+                    # Lingo.dev failed before the hedge - fall back to Google
+                    if provider == "lingodotdev" and not tasks:
+                        start_google()
+                    continue
+                if not results:
+                    continue
+                if tasks:
+                    print(f"[Translation] {provider} answered first")
+                for loser, (name, started) in tasks.items():
+                    loser.cancel()
+                    # Lower bound of the loser's latency (since it started, not
+                    # since the request), so slow periods still raise its percentile
+                    self.latency.record(name, time.perf_counter() - started)
+                return results, provider
+        return f"[Translation failed: {error}]", None
+
+    async def _timed(self, provider: str, call, texts: list, target: str) -> list:
+        """Run a provider call and record its latency when it succeeds."""
+        t0 = time.perf_counter()
+        results = await call(texts, target)
+        self.latency.record(provider, time.perf_counter() - t0)
+        return results
+
+    async def _lingo_engine(self):
+        """Lingo.dev engine with its HTTP client kept open (keep-alive) for reuse."""
+        async def open_engine():
+            engine = self._lingo_engine_class({"api_key": self.api_key})
+            return await engine.__aenter__()
+        return await self.runtime.client("lingodotdev", open_engine)
     
-    def _translate_with_lingodotdev(self, text: str, target_lang: str) -> str:
-        """Translate using Lingo.dev API."""
+    async def _translate_with_lingodotdev(self, texts: list, target_lang: str) -> list:
+        """Translate a batch using Lingo.dev API (one object localization request)."""
         try:
-            from lingodotdev.engine import LingoDotDevEngine
-            
-            # Run async translation in sync context
-            async def do_translate():
-                result = await LingoDotDevEngine.quick_translate(
-                    text,
-                    api_key=self.api_key,
-                    source_locale="auto",  # Auto-detect source
-                    target_locale=target_lang
-                )
-                return result
-            
-            # Run the async function
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(do_translate())
-            finally:
-                loop.close()
-            
-            return result if result else text
+            engine = await self._lingo_engine()
+            params = {
+                "source_locale": "auto",  # Auto-detect source
+                "target_locale": target_lang,
+                "fast": True,
+            }
+            if len(texts) == 1:
+                results = [await engine.localize_text(texts[0], params)]
+            else:
+                payload = {str(i): text for i, text in enumerate(texts)}
+                result = await engine.localize_object(payload, params, concurrent=True) or {}
+                results = [result.get(str(i)) for i in range(len(texts))]
+            # A missing answer is a failure (so Google gets a go), never the source text
+            if not all(results):
+                raise ValueError(f"no translation for {results.count(None) + results.count('')} of {len(texts)} segments")
+            return results
             
         except Exception as e:
             print(f"[Lingo.dev Translation Error] {e}")
             raise
+
+    def _google_for(self, target_lang: str):
+        """Cached GoogleTranslator per target language."""
+        if target_lang not in self._google_translators:
+            from deep_translator import GoogleTranslator
+            self._google_translators[target_lang] = GoogleTranslator(source='auto', target=target_lang)
+        return self._google_translators[target_lang]
     
-    def _translate_with_google(self, text: str, target_lang: str) -> str:
-        """Fallback translation using Google Translate."""
+    @staticmethod
+    def _google_batches(texts: list) -> list:
+        """Groups of texts whose newline-joined request stays under Google's size limit."""
+        batches, size = [[]], 0
+        for text in texts:
+            if batches[-1] and size + len(text) + 1 > GOOGLE_MAX_CHARS:
+                batches.append([])
+                size = 0
+            batches[-1].append(text)
+            size += len(text) + 1
+        return batches
+
+    async def _translate_with_google(self, texts: list, target_lang: str) -> list:
+        """
+        Fallback translation using Google Translate. The client is blocking
+        and has no batch endpoint, so segments go one per line in a single
+        request (per GOOGLE_MAX_CHARS) on the runtime's pool. If the lines
+        don't come back one for one, that group is sent segment by segment.
+        """
         try:
-            from deep_translator import GoogleTranslator
-            translator = GoogleTranslator(source='auto', target=target_lang)
-            result = translator.translate(text)
-            return result if result else text
+            translator = self._google_for(target_lang)
+            loop = asyncio.get_running_loop()
+
+            async def batch(group):
+                # Line breaks inside a segment would shift the lines
+                lines = [' '.join(text.split()) for text in group]
+                result = await loop.run_in_executor(None, translator.translate, '\n'.join(lines))
+                out = [line.strip() for line in (result or '').split('\n')]
+                if len(out) != len(group):
+                    out = await asyncio.gather(*[loop.run_in_executor(None, translator.translate, text)
+                                                 for text in group])
+                return out
+
+            results = [r for group in await asyncio.gather(*map(batch, self._google_batches(texts)))
+                       for r in group]
+            if not all(results):
+                raise ValueError(f"no translation for some of {len(texts)} segments")
+            return results
         except Exception as e:
             print(f"[Google Translation Error] {e}")
-            return f"[Translation failed: {e}]"
+            raise
+
+    def close(self):
+        """Report cache and latency stats and close the cache."""
+        if self.latency.summary():
+            print(f"[Translation] Latency: {self.latency.summary()}")
+        cache, self.cache = self.cache, None
+        if cache:
+            s = cache.stats()
+            print(f"[Cache] Hit rate {s['hit_rate']:.0%} ({s['memory_hits']} memory, "
+                  f"{s['disk_hits']} disk, {s['misses']} misses) | "
+                  f"lookup {s['lookup_ms']:.1f}ms vs network {s['network_ms']:.0f}ms")
+            cache.close()
 
     @staticmethod
     def get_supported_languages():
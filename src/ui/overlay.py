@@ -19,8 +19,10 @@ from config import (
 class OverlayWindow:
     """Optimized overlay window."""
 
-    def __init__(self, on_language_change=None, on_new_translation=None, on_summarize_click=None):
+    def __init__(self, on_language_change=None, on_new_translation=None, on_summarize_click=None,
+                 on_ready=None):
         self.on_language_change = on_language_change
+        self.on_ready = on_ready
         self.on_new_translation = on_new_translation
         self.on_summarize_click = on_summarize_click
         self.current_language = DEFAULT_TARGET_LANGUAGE
@@ -232,6 +234,8 @@ class OverlayWindow:
     def run(self):
         """Start overlay."""
         self._create_window()
+        if self.on_ready:
+            self.on_ready(self._root)
         print("[Overlay] Ready")
         self._root.mainloop()
 
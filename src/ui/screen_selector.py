@@ -1,84 +1,160 @@
 """
 Screen Selection Module for Lingo-Live
 Optimized for smooth, flicker-free selection.
+The overlay is built once and kept hidden; each selection only resets and
+shows it.
 """
 
 import tkinter as tk
-from PIL import Image, ImageGrab
+import sys
+import os
+import time
+from PIL import ImageEnhance, ImageTk
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import FREEZE_FRAME
+from services.capture_service import ScreenCaptureService
 
 
 class ScreenSelector:
     """Smooth fullscreen drag-to-select."""
 
-    def __init__(self, on_selection_complete=None):
+    def __init__(self, on_selection_complete=None, freeze_frame: bool = FREEZE_FRAME,
+                 capture: ScreenCaptureService = None):
         self.on_selection_complete = on_selection_complete
+        self.freeze_frame = freeze_frame
+        self.capture = capture or ScreenCaptureService()
         self.start_x = 0
         self.start_y = 0
         self.root = None
         self.rect = None
+        self.frame = None
+        self._owns_root = False
+        self._photo = None
+        self._shown_at = None
 
-    def start_selection(self):
-        """Show selection overlay."""
-        self.root = tk.Tk()
+    def build(self, parent=None):
+        """
+        Create the hidden overlay. With a `parent` it is a Toplevel of that
+        (already running) Tk app and is reused for every selection; without
+        one it gets its own root, as for a one-off start_selection().
+        Must be called on the Tk thread.
+        """
+        self._owns_root = parent is None
+        self.root = tk.Tk() if parent is None else tk.Toplevel(parent)
         self.root.withdraw()
-        
+
         # Get screen size
         w = self.root.winfo_screenwidth()
         h = self.root.winfo_screenheight()
-        
+
         # Configure fullscreen overlay
         self.root.geometry(f"{w}x{h}+0+0")
         self.root.overrideredirect(True)
         self.root.attributes('-topmost', True)
-        self.root.attributes('-alpha', 0.2)
         self.root.configure(bg='#000000')
         self.root.config(cursor="cross")
-        
+
         # Canvas
         self.canvas = tk.Canvas(self.root, width=w, height=h, highlightthickness=0, bg='#000000')
         self.canvas.pack()
-        
+        self._image_item = self.canvas.create_image(0, 0, anchor='nw')
+
         # Instructions
-        self.canvas.create_text(w//2, 40, text="Drag to select • ESC to cancel", 
+        self.canvas.create_text(w//2, 40, text="Drag to select • ESC to cancel",
                                 font=("Segoe UI", 14), fill="#00ff00")
-        
+
         # Events
         self.canvas.bind("<Button-1>", self._press)
         self.canvas.bind("<B1-Motion>", self._drag)
         self.canvas.bind("<ButtonRelease-1>", self._release)
+        self.canvas.bind("<Expose>", self._exposed)
         self.root.bind("<Escape>", self._cancel)
-        
+        self._size = (w, h)
+
+    def show(self, requested_at: float = None):
+        """
+        Reset and show the overlay (Tk thread). `requested_at` is the
+        time.perf_counter() of the hotkey press, used to log hotkey-to-crosshair time.
+        """
+        if self.root is None:
+            self.build()
+        self._shown_at = requested_at or time.perf_counter()
+
+        self.frame = None
+        if self.freeze_frame:
+            # Grab the screen before the overlay is visible and select on that frame
+            try:
+                self.frame = self.capture.grab_screen()
+            except Exception as e:
+                print(f"[Selection] Freeze-frame capture failed: {e}")
+
+        w, h = self._size
+        if self.rect:
+            self.canvas.delete(self.rect)
+            self.rect = None
+        if self.frame is not None:
+            shown = self.capture.to_image(self.frame)
+            if shown.size != (w, h):
+                shown = shown.resize((w, h))
+            self._photo = ImageTk.PhotoImage(ImageEnhance.Brightness(shown).enhance(0.6))
+            self._scale = (self.frame.shape[1] / w, self.frame.shape[0] / h)
+        else:
+            self._photo = None
+        self.canvas.itemconfigure(self._image_item, image=self._photo or '')
+        self.root.attributes('-alpha', 1.0 if self.frame is not None else 0.2)
+
         # Show
         self.root.deiconify()
+        self.root.lift()
         self.root.focus_force()
-        self.root.mainloop()
+
+    def _exposed(self, e=None):
+        if self._shown_at is not None:
+            print(f"[Selection] Hotkey to crosshair: {(time.perf_counter() - self._shown_at) * 1000:.0f}ms")
+            self._shown_at = None
+
+    def start_selection(self):
+        """Show selection overlay (standalone: builds its own root and runs until done)."""
+        if self.root is None:
+            self.build()
+        self.show()
+        if self._owns_root:
+            self.root.mainloop()
 
     def _press(self, e):
         self.start_x, self.start_y = e.x, e.y
         if self.rect:
             self.canvas.delete(self.rect)
-        self.rect = self.canvas.create_rectangle(e.x, e.y, e.x, e.y, 
+        self.rect = self.canvas.create_rectangle(e.x, e.y, e.x, e.y,
                                                    outline='#00ff00', width=2)
 
     def _drag(self, e):
-        self.canvas.coords(self.rect, self.start_x, self.start_y, e.x, e.y)
+        if self.rect:
+            self.canvas.coords(self.rect, self.start_x, self.start_y, e.x, e.y)
 
     def _release(self, e):
         x1, y1 = min(self.start_x, e.x), min(self.start_y, e.y)
         x2, y2 = max(self.start_x, e.x), max(self.start_y, e.y)
-        
+        frame = self.frame
+
         # Close overlay first
         self._close()
-        
+
         # Capture if valid area
         if x2 - x1 > 5 and y2 - y1 > 5:
-            # Small delay to let overlay close
-            import time
-            time.sleep(0.05)
-            
-            # Capture screen
-            img = ImageGrab.grab(bbox=(x1, y1, x2, y2))
-            
+            if frame is not None:
+                # Crop from the frozen frame - nothing to wait for
+                sx, sy = self._scale
+                img = self.capture.to_gray(
+                    frame[int(y1 * sy):int(y2 * sy), int(x1 * sx):int(x2 * sx)])
+            else:
+                # Small delay to let overlay close
+                time.sleep(0.05)
+
+                # Capture screen
+                img = self.capture.capture_gray(x1, y1, x2 - x1, y2 - y1)
+
             if self.on_selection_complete:
                 self.on_selection_complete(img, (x1, y1))
 
@@ -86,9 +162,19 @@ class ScreenSelector:
         self._close()
 
     def _close(self):
-        if self.root:
+        if not self.root:
+            return
+        self.frame = None
+        self._photo = None
+        if self._owns_root:
             try:
                 self.root.destroy()
             except:
                 pass
             self.root = None
+            self.rect = None
+        else:
+            # Keep the window for the next selection
+            self.canvas.itemconfigure(self._image_item, image='')
+            self.root.withdraw()
+            self.root.update_idletasks()